@@ -3,17 +3,121 @@ BasePage
 ========
 Minimal base class for page objects.
 Handles common browser interactions.
+
+Element cache
+-------------
+Page objects can look elements up through `cached_element` instead of calling
+`find_element` directly. References are cached per page object, keyed by
+locator, so repeated use costs no extra lookup. They are dropped when:
+
+- the page object navigates (`navigate`)
+- a cached reference raises `StaleElementReferenceException`; a new document
+  (e.g. after a form submit) makes every old reference stale, so
+  `with_cached_element` clears the cache and retries once
+
+Element lists are not cached: results are rendered into the same document
+asynchronously, so a list found earlier may be incomplete.
+
+Page performance
+----------------
+`navigate` records client-side timing metrics for the loaded page under
+`page_type` (see utils/page_performance.py) and drains captured network
+events when network capture is on (see utils/network_capture.py).
+
+Snapshots
+---------
+`snapshot(ready_locator)` waits for the ready locator, then captures
+`page_source` once so assertions can run against it off the browser (see
+utils/html_snapshot.py). It is reused while the element that satisfied the
+wait is still attached, and retaken once the document is replaced.
 """
 
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+
+from utils.constants import get_default_timeout
+from utils.html_snapshot import PageSnapshot
+from utils.network_capture import network_capture
+from utils.page_performance import page_performance
+from utils.wait_utils import wait_for_element_visible
+
+
 class BasePage:
+    # Groups performance metrics and budgets, overridden by each page object
+    page_type = "page"
+
     def __init__(self, browser):
         """Initialize with WebDriver instance."""
         self.browser = browser
+        self._element_cache = {}
 
     def navigate(self, url):
         """Navigate to a URL."""
         self.browser.get(url)
+        self.invalidate_cache()
+        network_capture.drain(self.browser)
+        page_performance.capture(self.browser, self.page_type)
 
     def get_title(self):
         """Return current page title."""
         return self.browser.title
+
+    def invalidate_cache(self):
+        """Drop every cached element reference for this page object."""
+        self._element_cache.clear()
+
+    def snapshot(self, ready_locator, timeout=None):
+        """
+        Returns a PageSnapshot of the current document, taken once `ready_locator` is visible.
+
+        :param ready_locator: (By, value) tuple that must be visible before the HTML is captured.
+        :param timeout: Timeout for the ready wait (default timeout if None).
+        :return: PageSnapshot, reused until the element that satisfied the wait goes stale.
+        """
+        key = ("snapshot", tuple(ready_locator))
+        if key in self._element_cache:
+            anchor, snapshot = self._element_cache[key]
+            try:
+                anchor.is_enabled()  # raises once the document has been replaced
+                return snapshot
+            except StaleElementReferenceException:
+                pass
+
+        visible = wait_for_element_visible(self.browser, ready_locator, timeout=timeout or get_default_timeout())
+        snapshot = PageSnapshot(self.browser.page_source)
+        self._element_cache[key] = (visible[0], snapshot)
+        return snapshot
+
+    def cached_element(self, locator, wait=None, timeout=None):
+        """
+        Returns the element for `locator`, reusing the cached reference when
+        there is one.
+
+        :param locator: (By, value) tuple.
+        :param wait: Optional wait_utils helper run before the first lookup.
+        :param timeout: Timeout passed to `wait`.
+        :return: WebElement.
+        """
+        key = tuple(locator)
+        if key not in self._element_cache:
+            waited = wait(self.browser, locator, timeout=timeout) if wait is not None else None
+            # Reuse the element the wait helper already returned (visibility waits return a list)
+            if isinstance(waited, list) and waited:
+                waited = waited[0]
+            self._element_cache[key] = waited if isinstance(waited, WebElement) \
+                else self.browser.find_element(*locator)
+        return self._element_cache[key]
+
+    def with_cached_element(self, locator, action, wait=None, timeout=None):
+        """
+        Runs `action(element)` against the cached element for `locator`.
+        If the reference has gone stale, the cache is cleared and the action
+        is retried once with a fresh lookup.
+
+        :return: Whatever `action` returns.
+        """
+        try:
+            return action(self.cached_element(locator, wait, timeout))
+        except StaleElementReferenceException:
+            self.invalidate_cache()
+            return action(self.cached_element(locator, wait, timeout))
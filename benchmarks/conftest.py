@@ -0,0 +1,58 @@
+"""
+Fixtures for the framework benchmarks
+✅ Serves benchmarks/fixture_pages on a local HTTP server
+✅ Points `config['base_url']` at that server so page objects run unchanged
+"""
+
+import functools
+import os
+import threading
+from urllib.parse import quote
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils.file_utils import FileUtils
+
+FIXTURE_PAGES_DIR = os.path.join(os.path.dirname(__file__), "fixture_pages")
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass  # keep benchmark output readable
+
+
+# -----------------------------------------------------------------------------
+# LOCAL FIXTURE SERVER
+# -----------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def fixture_server():
+    """Starts a static file server on a free port and returns its base URL."""
+    handler = functools.partial(_QuietHandler, directory=FIXTURE_PAGES_DIR)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+# -----------------------------------------------------------------------------
+# CONFIG FIXTURE (overrides the root one)
+# -----------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def config(fixture_server):
+    config = FileUtils.read_json('config/config.json')
+    config['base_url'] = fixture_server + "index.html"
+    # Keep page metric and step state collection out of the numbers; they are not part of the core path
+    config['page_performance'] = {"enabled": False}
+    config['state_recorder'] = {"enabled": False}
+    return config
+
+
+@pytest.fixture
+def results_url(fixture_server):
+    """Builds a results page URL for a query."""
+    def build(query, count=10):
+        return f"{fixture_server}results.html?q={quote(query)}&count={count}"
+    return build
@@ -0,0 +1,99 @@
+"""
+Framework overhead benchmarks (pytest-benchmark).
+
+These benchmarks measure what the framework itself costs, using the static
+pages in benchmarks/fixture_pages instead of DuckDuckGo:
+✅ Driver launch per browser preset
+✅ Each wait_utils helper, with and without the @allure.step wrapper
+✅ DuckDuckGoSearchPage.search typing path
+✅ DuckDuckGoResultPage extractors
+✅ Failure screenshot capture
+
+Run locally (GRID_URL unset) so typing delays and Grid latency stay out of the numbers.
+"""
+
+import pytest
+
+from locators.result_locators import DuckDuckGoResultLocators as Loc
+from pages.result import DuckDuckGoResultPage
+from pages.search import DuckDuckGoSearchPage
+from utils import driver_factory
+from utils import wait_utils
+from utils.screenshot_utils import capture_failure_screenshot
+
+PHRASE = "panda"
+LONG_QUERY = "a" * 500
+LOCAL_PRESETS = [name for name in driver_factory.load_presets() if name.endswith("-local")]
+
+# helper -> how to call it against a loaded results page
+WAIT_CALLS = {
+    "visible": (wait_utils.wait_for_element_visible,
+                lambda fn, browser: fn(browser, Loc.RESULT_TITLES, timeout=5)),
+    "presence": (wait_utils.wait_for_element_presence,
+                 lambda fn, browser: fn(browser, Loc.SEARCH_INPUT, timeout=5)),
+    "clickable": (wait_utils.wait_for_element_clickable,
+                  lambda fn, browser: fn(browser, Loc.FIRST_RESULT_LINK, timeout=5)),
+    "url_change": (wait_utils.wait_for_url_to_change,
+                   lambda fn, browser: fn(browser, "about:blank", timeout=5)),
+    "title_contains": (wait_utils.wait_for_title_contains,
+                       lambda fn, browser: fn(browser, PHRASE, timeout=5)),
+    "input_contains": (wait_utils.wait_for_input_contains,
+                       lambda fn, browser: fn(browser, Loc.SEARCH_INPUT, PHRASE, timeout=5)),
+}
+
+
+@pytest.mark.parametrize("preset_name", LOCAL_PRESETS)
+def test_driver_launch(benchmark, config, preset_name):
+    preset = driver_factory.load_presets()[preset_name]
+    launch_config = dict(config, browser=preset['browser'])
+    drivers = []
+    try:
+        benchmark.pedantic(
+            lambda: drivers.append(driver_factory.create_driver(launch_config, preset_name)),
+            rounds=3, iterations=1
+        )
+    finally:
+        for driver in drivers:
+            driver.quit()
+
+
+@pytest.mark.parametrize("allure_step", [True, False], ids=["with_step", "without_step"])
+@pytest.mark.parametrize("helper_name", list(WAIT_CALLS))
+def test_wait_helper_overhead(benchmark, browser, results_url, helper_name, allure_step):
+    browser.get(results_url(PHRASE))
+    helper, call = WAIT_CALLS[helper_name]
+    # __wrapped__ is the plain function underneath @allure.step
+    fn = helper if allure_step else helper.__wrapped__
+    benchmark(call, fn, browser)
+
+
+def test_search_typing(benchmark, browser, config):
+    search_page = DuckDuckGoSearchPage(browser, config)
+    benchmark.pedantic(search_page.search, args=(PHRASE,), setup=search_page.load, rounds=10)
+
+
+@pytest.mark.parametrize("extractor", ["title", "search_input_value", "result_link_titles", "result_count"])
+def test_result_page_extractor(benchmark, browser, results_url, extractor):
+    browser.get(results_url(PHRASE))
+    result_page = DuckDuckGoResultPage(browser)
+    benchmark(getattr(result_page, extractor))
+
+
+def test_long_query_extractor(benchmark, browser, results_url):
+    browser.get(results_url(LONG_QUERY))
+    result_page = DuckDuckGoResultPage(browser)
+    benchmark(result_page.long_query_result_page)
+
+
+def test_click_first_result(benchmark, browser, results_url):
+    result_page = DuckDuckGoResultPage(browser)
+    benchmark.pedantic(
+        result_page.click_first_result,
+        setup=lambda: browser.get(results_url(PHRASE)),
+        rounds=5
+    )
+
+
+def test_failure_screenshot_capture(benchmark, browser, results_url, tmp_path):
+    browser.get(results_url(PHRASE))
+    benchmark(capture_failure_screenshot, browser, "benchmarks::screenshot", directory=str(tmp_path))
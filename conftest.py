@@ -4,24 +4,62 @@ Shared fixtures for pytest
 ✅ Captures screenshots on test pass/fail
 """
 
-import os
 import time
-import requests
+_CONFTEST_IMPORT_STARTED = time.perf_counter()
+
+import os
 import pytest
-import selenium.webdriver
 import allure
-from datetime import datetime
 from utils.file_utils import FileUtils
+from utils import driver_factory
+from utils.screenshot_utils import capture_failure_screenshot
+from utils import page_performance as perf
+from utils.network_capture import network_capture
+from utils.browser_watchdog import BrowserSession, BrowserWatchdog
+from utils.html_snapshot import snapshot_mode
+from utils.state_recorder import state_recorder
+from utils import throttling
+from utils.profile_manager import profile_manager
+
+# -----------------------------------------------------------------------------
+# COMMAND LINE OPTIONS
+# -----------------------------------------------------------------------------
+def pytest_addoption(parser):
+    parser.addoption(
+        "--throttle-profiles", default="",
+        help="Comma-separated throttling profiles from config.json; "
+             "every browser test runs once per profile (e.g. none,3g,cpu-4x)"
+    )
+    parser.addoption(
+        "--browser-matrix", default="",
+        help="Comma-separated <browser>[:<preset>] targets; every browser test runs once per target "
+             "(e.g. Chrome,Firefox:firefox-grid). Overrides \"browser_matrix\" in config.json"
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "browser" not in metafunc.fixturenames:
+        return
+    targets = metafunc.config.browser_matrix
+    if targets:
+        metafunc.parametrize("browser_target", targets, indirect=True,
+                             ids=[target['id'] for target in targets], scope=scope_value)
 
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import WebDriverException, NoSuchElementException
-from locators.result_locators import DuckDuckGoResultLocators as Loc
+    profiles = [name for name in metafunc.config.getoption("throttle_profiles").split(",") if name]
+    if not profiles or metafunc.definition.get_closest_marker("throttle"):
+        return  # tests pinned to a profile keep it
+    metafunc.parametrize("throttle_profile", profiles, indirect=True)
 
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.firefox import GeckoDriverManager
+
+def pytest_collection_modifyitems(config, items):
+    # One xdist group per browser target: with `-n <targets> --dist loadgroup`
+    # each browser gets its own worker and the targets run side by side
+    if not config.browser_matrix:
+        return
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec and "browser_target" in callspec.params:
+            item.add_marker(pytest.mark.xdist_group(name=callspec.params["browser_target"]['id']))
 
 # -----------------------------------------------------------------------------
 # CONFIG FIXTURE
@@ -35,171 +73,202 @@ def config():
     assert 'base_url' in config and config['base_url'].strip(), "Missing or empty 'base_url'"
     return config
 
-# -----------------------------------------------------------------------------
-# HELPER: Check Selenium Grid Readiness
-# -----------------------------------------------------------------------------
-def wait_for_grid(grid_url, timeout=60):
-    print(f"⏳ Waiting for Selenium Grid to be ready at {grid_url} ...")
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            resp = requests.get(f"{grid_url}/status", timeout=5)
-            if resp.ok and "ready" in resp.text:
-                print("✅ Selenium Grid is ready.")
-                return True
-        except requests.exceptions.RequestException:
-            pass
-        print("🔄 Grid not ready yet. Retrying in 5 seconds...")
-        time.sleep(5)
-    raise RuntimeError("❌ Timeout: Selenium Grid was not ready after 60 seconds.")
-
 # -----------------------------------------------------------------------------
 # BROWSER FIXTURE
 # -----------------------------------------------------------------------------
 
 scope_value = "function" if os.getenv("PARALLEL", "False").lower() == "true" else "session"
 @pytest.fixture(scope=scope_value)
-def browser(config):
+def browser_target(request, config):
+    # Parametrized by the browser matrix; otherwise the single browser from config.json
+    return getattr(request, "param", None) or \
+        {"id": None, "browser": config['browser'], "preset": config.get('preset')}
+
+
+@pytest.fixture(scope="session")
+def profile_template_settings(config):
+    profile_manager.configure(config.get('profile_templates', {}))
+
+
+@pytest.fixture(scope=scope_value)
+def browser_session(config, browser_target, network_capture_settings, profile_template_settings):
     print(f"scope is {scope_value}")
-    browser_type = config['browser']
-    wait_time = config['implicit_wait']
-    grid_url = os.getenv("GRID_URL", "")
-
-    # Detect if running on Grid
-    #IS_GRID = "selenium-hub" in grid_url or "localhost" in grid_url or "4444" in grid_url
-    IS_GRID = bool(grid_url)
-    print(f"🌐 Running on {'Selenium Grid' if IS_GRID else 'Local WebDriver'}")
-
-    if IS_GRID:
-        wait_for_grid(grid_url)
-
-        if browser_type == 'Chrome':
-            options = ChromeOptions()
-            options.add_argument("--headless=new")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--window-size=1920,1080")
-            options.add_argument(
-                "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/126.0.0.0 Safari/537.36"
-            )
-        elif browser_type == 'Firefox':
-            options = FirefoxOptions()
-            options.add_argument("--headless")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--width=1920")
-            options.add_argument("--height=1080")
-            options.set_preference(
-                "general.useragent.override",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/126.0.0.0 Safari/537.36"
-            )
-        else:
-            raise ValueError(f"Unsupported browser for Grid: {browser_type}")
-
-        # Retry browser creation
-        for attempt in range(3):
-            try:
-                print(f"🔄 Attempt {attempt + 1}: Starting browser session...")
-                b = selenium.webdriver.Remote(
-                    command_executor=grid_url,
-                    options=options
-                )
-                print("✅ Browser session started successfully.")
-                break
-            except Exception as e:
-                print(f"⚠️ Attempt {attempt + 1}: Browser failed to start - {e}")
-                if attempt < 2:
-                    print("⏳ Retrying in 5 seconds...")
-                    time.sleep(5)
-                else:
-                    print("❌ All attempts to start browser failed.")
-                    raise
-    else:
-        if browser_type == 'Chrome':
-            options = ChromeOptions()
-            # Add headless and CI-safe flags
-            options.add_argument("--headless")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--window-size=1920,1080")
-
-            # ✅ UNIQUE user-data-dir for each parallel worker
-            import multiprocessing
-            profile_dir = f"/tmp/chrome-profile-{multiprocessing.current_process().pid}"
-            options.add_argument(f"--user-data-dir={profile_dir}")
-            print(f"📂 Using unique Chrome profile: {profile_dir}")
-
-            # Set user-agent
-            options.add_argument(
-                "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/126.0.0.0 Safari/537.36"
-            )
+    # Backend and options come from utils/driver_factory.py + config/browser_presets.json
+    session_config = dict(config, browser=browser_target['browser'], preset=browser_target['preset'])
+    session = BrowserSession(
+        session_config,
+        extra_capabilities=network_capture.capabilities(browser_target['browser'])
+    )
+    session.start()
+    yield session
+    session.quit()
+
+
+@pytest.fixture(scope=scope_value)
+def browser_watchdog(config, browser_target):
+    return BrowserWatchdog(config.get('watchdog', {}))
+
+
+@pytest.fixture
+def browser(browser_session, browser_watchdog, browser_target, page_performance):
+    # Between tests: swap in a fresh browser if the current one is over its limits
+    reason = browser_watchdog.check(browser_session.driver)
+    if reason:
+        browser_session.recycle(reason)
+        browser_watchdog.session_recycled()
+    browser_watchdog.test_started()
+    if browser_target['id']:
+        # Matrix run: group the Allure report and the performance summary per browser
+        allure.dynamic.parent_suite(browser_target['id'])
+        allure.dynamic.tag(browser_target['browser'])
+        page_performance.browser_target = browser_target['id']
+    return browser_session.driver
+
+# -----------------------------------------------------------------------------
+# SNAPSHOT ASSERTIONS (opt-in)
+# -----------------------------------------------------------------------------
+@pytest.fixture(scope="session", autouse=True)
+def snapshot_assertion_settings(config):
+    snapshot_mode.configure(config.get('snapshot_assertions', {}))
+
+# -----------------------------------------------------------------------------
+# RECENT PAGE STATES (flushed on failure)
+# -----------------------------------------------------------------------------
+@pytest.fixture(scope="session", autouse=True)
+def state_recorder_settings(config):
+    import allure_commons
+
+    state_recorder.configure(config.get('state_recorder', {}))
+    allure_commons.plugin_manager.register(state_recorder)
+    yield
+    allure_commons.plugin_manager.unregister(state_recorder)
+
+
+@pytest.fixture(autouse=True)
+def recent_page_states(request, state_recorder_settings):
+    if "browser" in request.fixturenames:
+        state_recorder.start_test(request.getfixturevalue("browser"))
+    yield
+    state_recorder.finish_test()
+
+# -----------------------------------------------------------------------------
+# PAGE PERFORMANCE
+# -----------------------------------------------------------------------------
+@pytest.fixture(scope="session", autouse=True)
+def page_performance_settings(config):
+    perf.page_performance.configure(config.get('page_performance', {}))
 
-            service = ChromeService(ChromeDriverManager().install())
-            b = selenium.webdriver.Chrome(service=service, options=options)
-        elif browser_type == 'Firefox':
-            options = FirefoxOptions()
-            # Add headless and CI-safe flags
-            options.add_argument("--headless")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--window-size=1920,1080")
-            options.set_preference(
-                "general.useragent.override",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/126.0.0.0 Safari/537.36"
+
+@pytest.fixture(autouse=True)
+def page_performance(request, page_performance_settings):
+    perf.page_performance.start_test(request.node.nodeid)
+    yield perf.page_performance
+    perf.page_performance.finish_test()
+
+
+def pytest_configure(config):
+    # Only the controller clears old metrics; xdist workers append to their own file
+    if not hasattr(config, "workerinput"):
+        perf.reset_reports()
+        profile_manager.prune_stale_runs()
+        # xdist hands the controller's testrunuid to every worker, so all of them share one template folder
+        if hasattr(config.option, "testrunuid"):
+            config.option.testrunuid = config.option.testrunuid or profile_manager.run_id
+            profile_manager.run_id = config.option.testrunuid
+
+    # Validate --browser-matrix and --throttle-profiles up front instead of erroring every test
+    settings = FileUtils.read_json('config/config.json')
+    matrix = config.getoption("browser_matrix")
+    entries = matrix.split(",") if matrix else settings.get('browser_matrix', [])
+    try:
+        config.browser_matrix = driver_factory.parse_browser_matrix([entry for entry in entries if entry])
+        for name in config.getoption("throttle_profiles").split(","):
+            if name and name != "none":
+                throttling.resolve_profile(settings, name)
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput"):
+        return
+    summary = perf.summarize()
+    if not summary:
+        return
+    terminalreporter.section("page performance (ms)")
+    for page_type, metrics in sorted(summary.items()):
+        for metric, stats in sorted(metrics.items()):
+            terminalreporter.write_line(
+                f"{page_type:<32} {metric:<26} n={stats['count']:<4} "
+                f"p50={stats['p50']:<10} p90={stats['p90']:<10} p95={stats['p95']}"
             )
-            service = FirefoxService(GeckoDriverManager().install())
-            b = selenium.webdriver.Firefox(service=service, options=options)
-        else:
-            raise ValueError(f"Unsupported browser: {browser_type}")
 
-    b.implicitly_wait(wait_time)
-    b.maximize_window()
-    yield b
-    b.quit()
+# -----------------------------------------------------------------------------
+# THROTTLING PROFILES (@pytest.mark.throttle("3g") or --throttle-profiles)
+# -----------------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def throttle_profile(request, config, page_performance):
+    marker = request.node.get_closest_marker("throttle")
+    name = marker.args[0] if marker else getattr(request, "param", None)
+    if not name or name == "none" or "browser" not in request.fixturenames:
+        yield name
+        return
+
+    profile = throttling.resolve_profile(config, name)
+    browser = request.getfixturevalue("browser")
+    applied = throttling.apply_profile(browser, name, profile)
+    if applied:
+        page_performance.throttle_profile = name
+        allure.dynamic.parameter("throttle_profile", name)
+    yield name
+    if applied:
+        throttling.reset_throttling(browser)
 
 # -----------------------------------------------------------------------------
-# SCREENSHOT HOOK
+# NETWORK CAPTURE (opt-in, Chrome only)
 # -----------------------------------------------------------------------------
-base_reports_dir = os.path.join(os.getcwd(), "reports", "screenshots")
-failed_dir = os.path.join(base_reports_dir, "failed")
-os.makedirs(failed_dir, exist_ok=True)
+@pytest.fixture(scope="session")
+def network_capture_settings(config):
+    network_capture.configure(config.get('network_capture', {}))
 
+
+@pytest.fixture(autouse=True)
+def network_capture_per_test(request, page_performance, network_capture_settings):
+    if "browser" not in request.fixturenames or not network_capture.enabled:
+        yield
+        return
+    browser = request.getfixturevalue("browser")
+    network_capture.start_test(browser, request.node.nodeid)
+    yield
+    report = getattr(request.node, "rep_call", None)
+    failed = report is not None and report.failed
+    network_capture.finish_test(browser, keep=failed or bool(page_performance.violations))
+
+# -----------------------------------------------------------------------------
+# SCREENSHOT HOOK
+# -----------------------------------------------------------------------------
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
+    # Expose the result to fixtures (e.g. network capture keeps its HAR on failure)
+    setattr(item, f"rep_{report.when}", report)
 
     if report.when == "call" and report.outcome == "failed":
         browser = item.funcargs.get("browser", None)
         if not browser:
             print("⚠️ No browser session available for screenshot.")
             return
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        test_name = report.nodeid.replace("::", "_").replace("/", "_")
-        screenshot_name = f"{test_name}_{timestamp}.png"
-        screenshot_path = os.path.join(failed_dir, screenshot_name)
-        try:
-            browser.save_screenshot(screenshot_path)
-            allure.attach.file(
-                screenshot_path,
-                name=f"{test_name}_FAILED",
-                attachment_type=allure.attachment_type.PNG
-            )
-            print(f"📸 Screenshot saved for FAILED test: {screenshot_path}")
-        except WebDriverException as e:
-            if "invalid session id" in str(e).lower():
-                print("⚠️ Browser session ended before screenshot could be taken.")
-            else:
-                print(f"⚠️ Could not save screenshot: {e}")
-        except Exception as e:
-            print(f"⚠️ Unexpected error saving screenshot: {e}")
+        capture_failure_screenshot(browser, report.nodeid)
+        state_recorder.flush(report.nodeid)
+
+# -----------------------------------------------------------------------------
+# STARTUP BUDGET REPORT & PROFILE CLEANUP
+# -----------------------------------------------------------------------------
+def pytest_sessionfinish(session):
+    driver_factory.report_startup()
+    if not hasattr(session.config, "workerinput"):
+        profile_manager.remove_run()
+
+
+driver_factory.record_startup_phase("conftest_import", time.perf_counter() - _CONFTEST_IMPORT_STARTED)
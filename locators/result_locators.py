@@ -13,6 +13,7 @@ class DuckDuckGoResultLocators:
    # RESULT_TITLES = (By.CSS_SELECTOR, "ol.react-results--main li[data-layout='organic'] a")  # Search result links
     RESULT_TITLES = ( By.XPATH, "//li[@data-layout='organic']//a | //a[@data-testid='result-title-a']" )
     SEARCH_INPUT = (By.ID, 'search_form_input')       # Search input box on result page
+    RESULTS_CONTAINER = (By.CSS_SELECTOR, "div.results--main")  # Present with or without results
     LONG_QUERY_ERROR = (By.XPATH, "//p[contains(text(), 'Search query entered was too long')]")  # Error for long queries
     FIRST_RESULT_LINK = (By.XPATH, "//article[@id='r1-0']//a[@data-testid='result-title-a']")
     CAPTCHA_DIV = (By.CSS_SELECTOR, "div.captcha__container")
\ No newline at end of file
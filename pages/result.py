@@ -10,9 +10,11 @@ from utils.constants import get_default_timeout
 from utils.wait_utils import wait_for_element_visible
 from utils.wait_utils import wait_for_element_clickable
 from utils.wait_utils import wait_for_url_to_change
+from utils.html_snapshot import snapshot_mode
 from base.base_page import BasePage   #inheritace
 
 class DuckDuckGoResultPage(BasePage):
+    page_type = "results"
 
     def __init__(self, browser):
         super().__init__(browser)  #super() → Finds parent BasePage
@@ -25,13 +27,17 @@ class DuckDuckGoResultPage(BasePage):
         :return: List of visible result link texts.
         :raises AssertionError: If no results are visible within timeout.
         """
-        wait_for_element_visible(self.browser, Loc.RESULT_TITLES, timeout = get_default_timeout())
+        if snapshot_mode.enabled:
+            # Snapshot mode: wait for the titles once, then read them off the browser
+            visible_titles = self.snapshot(Loc.RESULT_TITLES).visible_texts(Loc.RESULT_TITLES)
+        else:
+            wait_for_element_visible(self.browser, Loc.RESULT_TITLES, timeout = get_default_timeout())
 
-        # Get all result link elements
-        result_elements = self.browser.find_elements(*Loc.RESULT_TITLES)
+            # Get all result link elements
+            result_elements = self.browser.find_elements(*Loc.RESULT_TITLES)
 
-        # Filter only visible links and extract their text
-        visible_titles = [link.text for link in result_elements if link.is_displayed()]
+            # Filter only visible links and extract their text
+            visible_titles = [link.text for link in result_elements if link.is_displayed()]
 
         # Assert at least one visible search result exists
         assert visible_titles, "No visible search result titles found."
@@ -45,9 +51,12 @@ class DuckDuckGoResultPage(BasePage):
 
         :return: String value from the search input field.
         """
-        wait_for_element_visible(self.browser, Loc.SEARCH_INPUT, timeout = get_default_timeout())
-        input_field = self.browser.find_element(*Loc.SEARCH_INPUT)
-        return input_field.get_attribute('value')
+        return self.with_cached_element(
+            Loc.SEARCH_INPUT,
+            lambda input_field: input_field.get_attribute('value'),
+            wait=wait_for_element_visible,
+            timeout=get_default_timeout()
+        )
 
     @allure.step("Get current page title")
     def title(self):
@@ -61,7 +70,10 @@ class DuckDuckGoResultPage(BasePage):
            """
         try:
             # Look for all result links (if any)
-            links = self.browser.find_elements(*Loc.RESULT_TITLES)
+            if snapshot_mode.enabled:
+                links = self.snapshot(Loc.RESULTS_CONTAINER).find_elements(Loc.RESULT_TITLES)
+            else:
+                links = self.browser.find_elements(*Loc.RESULT_TITLES)
             count = len(links)
             return count
         except:
@@ -73,7 +85,10 @@ class DuckDuckGoResultPage(BasePage):
         """
         Checks if the results page is loaded with error for long query search results.
         """
-        long_query_message = self.browser.find_element(*Loc.LONG_QUERY_ERROR)
+        if snapshot_mode.enabled:
+            long_query_message = self.snapshot(Loc.LONG_QUERY_ERROR).find_element(Loc.LONG_QUERY_ERROR)
+        else:
+            long_query_message = self.browser.find_element(*Loc.LONG_QUERY_ERROR)
         error_text = long_query_message.text
         return error_text
 
@@ -13,9 +13,11 @@ from utils.constants import get_default_timeout
 # for importing helper functions for explicit waits mentioned in wait_utils.py
 from utils.wait_utils import wait_for_element_visible
 from utils.wait_utils import wait_for_element_clickable
+from utils.page_performance import page_performance
 from base.base_page import BasePage  #inheritance
 
 class DuckDuckGoSearchPage(BasePage):
+    page_type = "search"
 
     #constructor
     def __init__(self, browser, config):
@@ -31,9 +33,6 @@ class DuckDuckGoSearchPage(BasePage):
 
     @allure.step("Search for phrase: {phrase}")
     def search(self, phrase):
-        # Wait until the search input is clickable
-        search_input = wait_for_element_clickable(self.browser, Loc.SEARCH_INPUT,timeout = get_default_timeout())
-        search_input.clear()
         """
            Types the text character by character with a random delay,
            and waits explicitly for the search button/input to be interactable.this is done as step for CAPTHA
@@ -43,24 +42,35 @@ class DuckDuckGoSearchPage(BasePage):
         #IS_GRID = "selenium-hub" in grid_url or "localhost" in grid_url or "4444" in grid_url
         IS_GRID = bool(grid_url)
         TYPING_DELAY = random.uniform(0.05, 0.2) if IS_GRID and random.choice([True, False]) else 0  # No delay locally
-        for char in phrase:
-            search_input.send_keys(char)
-            if TYPING_DELAY:
-                time.sleep(TYPING_DELAY)
-        # types and presses Enter (Keys.RETURN simulates pressing Enter)
-        search_input.send_keys(Keys.RETURN)
+
+        def type_phrase(search_input):
+            search_input.clear()
+            for char in phrase:
+                search_input.send_keys(char)
+                if TYPING_DELAY:
+                    time.sleep(TYPING_DELAY)
+            # types and presses Enter (Keys.RETURN simulates pressing Enter)
+            search_input.send_keys(Keys.RETURN)
+
+        # Wait until the search input is clickable; retried once if the cached reference went stale
+        self.with_cached_element(Loc.SEARCH_INPUT, type_phrase,
+                                 wait=wait_for_element_clickable, timeout=get_default_timeout())
 
     @allure.step("Wait for search results to load")
     def search_result_wait(self):
         # WAIT: Ensure results have loaded
         wait_for_element_visible(self.browser, Loc.SEARCH_RESULTS, timeout = get_default_timeout())
+        page_performance.mark(self.browser, "results", "results_visible")
+        page_performance.capture(self.browser, "results")
 
     @allure.step("Wait for long query search results to load")
     def search_result_long_query_wait(self):
         # WAIT: Ensure results for long query have loaded
         wait_for_element_visible(self.browser, Loc.LONG_QUERY_SEARCH_RESULT,timeout = get_default_timeout())
+        page_performance.capture(self.browser, "results")
 
     @allure.step("Wait for gibberish search results to load")
     def search_result_gibberish_wait(self):
         # WAIT: Ensure results for gibberish query have loaded
-        wait_for_element_visible(self.browser, Loc.GIBBERISH_SEARCH_RESULT,timeout = get_default_timeout())
\ No newline at end of file
+        wait_for_element_visible(self.browser, Loc.GIBBERISH_SEARCH_RESULT,timeout = get_default_timeout())
+        page_performance.capture(self.browser, "results")
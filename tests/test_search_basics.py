@@ -48,6 +48,7 @@ def test_basic_duckduckgo_search(browser, config, phrase):
 
     # GIVEN: Load the DuckDuckGo home page
     search_page = DuckDuckGoSearchPage(browser, config)
+    result_page = DuckDuckGoResultPage(browser)
     search_page.load()
 
     # Reset cookies and storage for session reuse
@@ -67,7 +68,7 @@ def test_basic_duckduckgo_search(browser, config, phrase):
     wait_for_title_contains(browser, phrase, timeout = get_default_timeout())
 
     # THEN: Verify the page title contains the search phrase
-    actual_title = DuckDuckGoResultPage(browser).title()
+    actual_title = result_page.title()
     assert phrase.lower() in actual_title.lower(), \
         f"Expected phrase '{phrase}' in page title, got '{actual_title}'"
     logger.info("Verified page title contains the phrase.")
@@ -75,14 +76,14 @@ def test_basic_duckduckgo_search(browser, config, phrase):
     # WAIT: Ensure search input contains search phrase
     wait_for_input_contains(browser, Loc.SEARCH_INPUT, phrase, timeout = get_default_timeout())
 
-    actual_input = DuckDuckGoResultPage(browser).search_input_value()
+    actual_input = result_page.search_input_value()
     # AND: Verify the search input still contains the search phrase
     assert phrase.lower() in actual_input.lower(), \
         f"Expected '{phrase}' in search input, but got '{actual_input}'"
     logger.info("Verified search input retains the phrase.")
 
     # AND: Verify result links contain the search phrase
-    titles = DuckDuckGoResultPage(browser).result_link_titles()
+    titles = result_page.result_link_titles()
     matches = [t for t in titles if phrase.lower() in t.lower()]
     assert len(matches) > 0, f"No search results contain the phrase '{phrase}'."
     assert matches, f"No search result titles contained the phrase '{phrase}'. Found: {titles}"
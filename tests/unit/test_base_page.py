@@ -0,0 +1,64 @@
+"""
+Unit tests for the element cache in base/base_page.py (no browser needed).
+
+These tests verify:
+✅ The element returned by a wait helper is reused, without another lookup
+✅ A stale cached reference is looked up again once
+"""
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from base.base_page import BasePage
+
+pytestmark = pytest.mark.unit
+
+LOCATOR = (By.NAME, "q")
+
+
+class FakeElement(WebElement):
+    def __init__(self, value):
+        self.value = value
+        self.stale = False
+
+    def get_attribute(self, name):
+        if self.stale:
+            raise StaleElementReferenceException()
+        return self.value
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.calls = []
+
+    def find_element(self, by, value):
+        self.calls.append("find_element")
+        return FakeElement("found")
+
+
+def test_visibility_wait_result_is_reused():
+    waits = []
+
+    def visible_wait(browser, locator, timeout):
+        waits.append(locator)
+        return [FakeElement("waited")]  # like visibility_of_any_elements_located
+
+    browser = FakeBrowser()
+    page = BasePage(browser)
+    read_value = lambda element: element.get_attribute("value")
+
+    assert page.with_cached_element(LOCATOR, read_value, wait=visible_wait, timeout=1) == "waited"
+    assert page.with_cached_element(LOCATOR, read_value, wait=visible_wait, timeout=1) == "waited"
+    assert waits == [LOCATOR]
+    assert browser.calls == []
+
+
+def test_stale_reference_is_looked_up_again():
+    browser = FakeBrowser()
+    page = BasePage(browser)
+    page.cached_element(LOCATOR).stale = True
+
+    assert page.with_cached_element(LOCATOR, lambda element: element.get_attribute("value")) == "found"
+    assert browser.calls == ["find_element", "find_element"]
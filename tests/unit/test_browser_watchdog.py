@@ -0,0 +1,79 @@
+"""
+Unit tests for utils/browser_watchdog.py (no browser needed).
+
+These tests verify:
+✅ The watchdog keeps a healthy browser and recycles one over its limits
+✅ A browser or driver process that no longer answers is recycled
+✅ The CDP fallback for the JS heap size
+"""
+
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from utils.browser_watchdog import BrowserWatchdog
+
+pytestmark = pytest.mark.unit
+
+_MB = 1024 * 1024
+
+
+class FakeDriver:
+    """Answers the JS heap script; no `service`, like a Remote session."""
+
+    def __init__(self, js_heap=None, error=None):
+        self.js_heap = js_heap
+        self.error = error
+
+    def execute_script(self, script, *args):
+        if self.error:
+            raise self.error
+        return self.js_heap
+
+
+class FakeCdpDriver(FakeDriver):
+    def execute_cdp_cmd(self, command, params):
+        return {"metrics": [{"name": "JSHeapUsedSize", "value": 300 * _MB}]}
+
+
+def watchdog(**settings):
+    return BrowserWatchdog(dict({"enabled": True, "max_tests_per_session": 3, "max_js_heap_mb": 512}, **settings))
+
+
+def test_healthy_browser_is_kept():
+    assert watchdog().check(FakeDriver(js_heap=100 * _MB)) is None
+
+
+def test_disabled_watchdog_never_recycles():
+    assert watchdog(enabled=False).check(FakeDriver(error=InvalidSessionIdException("gone"))) is None
+
+
+def test_recycles_after_max_tests():
+    dog = watchdog()
+    for _ in range(3):
+        dog.test_started()
+    assert dog.check(FakeDriver()) == "3 tests run (max_tests_per_session=3)"
+
+    dog.session_recycled()
+    assert dog.check(FakeDriver()) is None
+
+
+def test_recycles_over_js_heap_limit():
+    assert watchdog().check(FakeDriver(js_heap=600 * _MB)) == "600MB JS heap exceeds limit of 512MB JS heap"
+
+
+def test_dead_browser_is_recycled():
+    reason = watchdog().check(FakeDriver(error=InvalidSessionIdException("invalid session id\nStacktrace: ...")))
+    assert reason == "browser is not responding (invalid session id)"
+
+
+def test_js_heap_falls_back_to_cdp():
+    assert watchdog().sample(FakeCdpDriver())["js_heap_mb"] == 300
+    assert watchdog().sample(FakeDriver())["js_heap_mb"] is None
+
+
+def test_killed_driver_process_is_recycled():
+    error = MaxRetryError(None, "/session/abc/execute/sync",
+                          NewConnectionError(None, "Failed to establish a new connection: [Errno 111] Connection refused"))
+    reason = watchdog().check(FakeDriver(error=error))
+    assert reason.startswith("browser is not responding (")
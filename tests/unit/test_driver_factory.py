@@ -0,0 +1,35 @@
+"""
+Unit tests for browser matrix parsing in utils/driver_factory.py (no browser needed).
+
+These tests verify:
+✅ "<browser>[:<preset>]" entries become matrix targets
+✅ Unknown browsers, unknown or mismatched presets and duplicates are rejected
+"""
+
+import pytest
+
+from utils.driver_factory import parse_browser_matrix
+
+pytestmark = pytest.mark.unit
+
+
+def test_browser_and_preset_entries():
+    assert parse_browser_matrix(["Chrome", " Firefox:firefox-grid "]) == [
+        {"id": "chrome", "browser": "Chrome", "preset": None},
+        {"id": "firefox-grid", "browser": "Firefox", "preset": "firefox-grid"},
+    ]
+
+
+def test_empty_matrix():
+    assert parse_browser_matrix([]) == []
+
+
+@pytest.mark.parametrize("entries, message", [
+    (["Safari"], "Unsupported browser in matrix: Safari"),
+    (["Chrome:chrome-nightly"], "Unknown browser preset: chrome-nightly"),
+    (["Firefox:chrome-local"], "Preset 'chrome-local' is for Chrome, not Firefox"),
+    (["Chrome", "Chrome"], "Duplicate entries in browser matrix: chrome, chrome"),
+])
+def test_invalid_entries(entries, message):
+    with pytest.raises(ValueError, match=message):
+        parse_browser_matrix(entries)
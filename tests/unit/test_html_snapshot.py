@@ -0,0 +1,124 @@
+"""
+Unit tests for utils/html_snapshot.py and BasePage.snapshot() (no browser needed).
+
+These tests verify:
+✅ Selenium locators are translated to XPath
+✅ Visibility and text follow what a snapshot can see, like WebElement.text
+✅ Snapshots wait for their ready locator and are retaken once the document changes
+"""
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+import base.base_page as base_page_module
+from base.base_page import BasePage
+from utils.html_snapshot import PageSnapshot, locator_to_xpath
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+pytestmark = pytest.mark.unit
+
+PAGE = """
+<html><head><title>t</title><script>var a = "script text";</script></head><body>
+  <ol>
+    <li data-layout="organic"><a id="r1" class="title" name="first">Panda <span style="display:none">hidden</span> bear</a></li>
+    <li data-layout="organic" hidden><a class="title">Hidden result</a></li>
+    <li data-layout="organic"><a class="title" style="visibility: hidden">Invisible</a></li>
+    <li data-layout="organic"><a class="title">Polar<br>bear <!-- note --> cub</a></li>
+  </ol>
+  <input type="hidden" name="token" value="x">
+  <p>It's "quoted"</p>
+</body></html>
+"""
+
+
+@pytest.mark.parametrize("locator, expected", [
+    ((By.XPATH, "//a"), "//a"),
+    ((By.ID, "r1"), "//*[@id='r1']"),
+    ((By.NAME, "first"), "//*[@name='first']"),
+    ((By.TAG_NAME, "li"), "//li"),
+    ((By.LINK_TEXT, "It's"), '//a[normalize-space(.)="It\'s"]'),
+    ((By.PARTIAL_LINK_TEXT, "Panda"), "//a[contains(., 'Panda')]"),
+])
+def test_locator_to_xpath(locator, expected):
+    assert locator_to_xpath(locator) == expected
+
+
+def test_xpath_literal_with_both_quote_types():
+    assert locator_to_xpath((By.ID, "a'b\"c")) == "//*[@id=concat('a', \"'\", 'b\"c')]"
+
+
+def test_css_and_class_name_locators_match():
+    snapshot = PageSnapshot(PAGE)
+    assert len(snapshot.find_elements((By.CSS_SELECTOR, "li[data-layout='organic'] a"))) == 4
+    assert len(snapshot.find_elements((By.CLASS_NAME, "title"))) == 4
+
+
+def test_unsupported_locator_strategy():
+    with pytest.raises(ValueError, match="Unsupported locator strategy"):
+        locator_to_xpath(("-ios predicate string", "x"))
+
+
+def test_visible_texts_skip_hidden_elements_and_descendants():
+    texts = PageSnapshot(PAGE).visible_texts((By.XPATH, "//li[@data-layout='organic']//a"))
+    assert texts == ["Panda bear", "Polar bear cub"]
+
+
+def test_hidden_element_has_empty_text():
+    element = PageSnapshot(PAGE).find_element((By.XPATH, "//a[contains(., 'Hidden result')]"))
+    assert element.is_displayed() is False
+    assert element.text == ""
+
+
+def test_non_rendered_tags_and_hidden_inputs_are_not_displayed():
+    snapshot = PageSnapshot(PAGE)
+    assert snapshot.find_element((By.TAG_NAME, "script")).is_displayed() is False
+    assert snapshot.find_element((By.NAME, "token")).is_displayed() is False
+    assert snapshot.find_element((By.NAME, "token")).get_attribute("value") == "x"
+
+
+def test_find_element_raises_when_missing():
+    with pytest.raises(NoSuchElementException):
+        PageSnapshot(PAGE).find_element((By.ID, "missing"))
+
+
+class FakeAnchor:
+    stale = False
+
+    def is_enabled(self):
+        if self.stale:
+            raise StaleElementReferenceException()
+        return True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.page_source_reads = 0
+
+    @property
+    def page_source(self):
+        self.page_source_reads += 1
+        return PAGE
+
+
+def test_snapshot_waits_for_ready_locator_and_is_retaken_after_document_change(monkeypatch):
+    anchors = []
+
+    def fake_wait(browser, locator, timeout):
+        anchors.append(FakeAnchor())
+        return [anchors[-1]]
+
+    monkeypatch.setattr(base_page_module, "wait_for_element_visible", fake_wait)
+    browser = FakeBrowser()
+    page = BasePage(browser)
+    ready = (By.ID, "r1")
+
+    first = page.snapshot(ready)
+    assert page.snapshot(ready) is first
+    assert len(anchors) == 1 and browser.page_source_reads == 1
+
+    anchors[0].stale = True  # new document
+    assert page.snapshot(ready) is not first
+    assert len(anchors) == 2 and browser.page_source_reads == 2
@@ -0,0 +1,82 @@
+"""
+Unit tests for utils/load_runner.py (no browser needed).
+
+These tests verify:
+✅ Step statistics with no samples, only errors and mixed samples
+✅ Interval windows reset while the run totals keep counting
+✅ The sample CSV and the run summary are written on close
+"""
+
+import csv
+import json
+
+import pytest
+
+from utils.load_runner import STEPS, LoadResults, _step_stats
+
+pytestmark = pytest.mark.unit
+
+
+def test_step_stats_without_samples():
+    assert _step_stats([], 0) == {"count": 0, "errors": 0, "error_rate": 0.0}
+
+
+def test_step_stats_with_only_errors():
+    assert _step_stats([], 3) == {"count": 3, "errors": 3, "error_rate": 1.0}
+
+
+def test_step_stats_percentiles_and_error_rate():
+    stats = _step_stats([float(ms) for ms in range(1, 101)], 25)
+    assert stats["count"] == 125 and stats["errors"] == 25 and stats["error_rate"] == 0.2
+    assert (stats["p50"], stats["p90"], stats["p95"], stats["p99"]) == (50, 90, 95, 99)
+
+
+@pytest.fixture
+def results(tmp_path):
+    results = LoadResults(str(tmp_path))
+    yield results
+    if not results._samples_file.closed:
+        results.close()
+
+
+def test_flush_interval_resets_the_window_but_not_the_run(results):
+    results.record(0, 1, "load", 100)
+    results.record(0, 1, "type", 50, error="TimeoutException")
+    results.iteration_done()
+
+    first = results.flush_interval(2)
+    assert first["throughput_per_s"] == 0.5
+    assert first["steps"]["load"] == {"count": 1, "errors": 0, "error_rate": 0.0,
+                                      "p50": 100, "p90": 100, "p95": 100, "p99": 100}
+    assert first["steps"]["type"]["error_rate"] == 1.0
+
+    results.record(1, 1, "load", 300)
+    second = results.flush_interval(2)
+    assert second["throughput_per_s"] == 0.0
+    assert second["steps"]["load"]["count"] == 1 and second["steps"]["load"]["p50"] == 300
+    assert second["steps"]["type"]["count"] == 0
+
+    summary = results.close()
+    assert summary["iterations"] == 1
+    assert summary["steps"]["load"]["count"] == 2 and summary["steps"]["load"]["p99"] == 300
+    assert summary["steps"]["type"]["errors"] == 1
+
+    with open(results.timeseries_path, encoding='utf-8') as file:
+        assert len(file.readlines()) == 2
+
+
+def test_close_writes_csv_header_and_summary(results):
+    results.record(0, 1, "load", 120.04)
+    results.record(0, 1, "results_visible", 80, error="AssertionError")
+
+    summary = results.close()
+
+    with open(results.samples_path, newline='', encoding='utf-8') as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["timestamp", "user", "iteration", "step", "latency_ms", "ok", "error"]
+    assert [row[1:] for row in rows[1:]] == [["0", "1", "load", "120.0", "True", ""],
+                                             ["0", "1", "results_visible", "80", "False", "AssertionError"]]
+
+    with open(results.summary_path, encoding='utf-8') as file:
+        assert json.load(file) == summary
+    assert set(summary["steps"]) == set(STEPS)
@@ -0,0 +1,135 @@
+"""
+Unit tests for utils/network_capture.py (no browser needed).
+
+These tests verify:
+✅ Performance log events become HAR entries streamed to disk
+✅ Redirects, failures and in-flight eviction
+✅ The HAR file is kept only when asked, and only for Chrome
+"""
+
+import json
+import os
+
+import pytest
+
+from utils import network_capture as capture_module
+from utils.network_capture import NetworkCapture
+
+pytestmark = pytest.mark.unit
+
+
+class FakeBrowser:
+    """Serves queued DevTools messages through get_log("performance")."""
+
+    name = "chrome"
+
+    def __init__(self):
+        self.queued = []
+
+    def send(self, method, **params):
+        self.queued.append({"message": json.dumps({"message": {"method": method, "params": params}})})
+
+    def get_log(self, log_type):
+        entries, self.queued = self.queued, []
+        return entries
+
+
+def request_sent(browser, request_id, url, timestamp, **extra):
+    browser.send("Network.requestWillBeSent", requestId=request_id, timestamp=timestamp,
+                 wallTime=1700000000 + timestamp, request={"method": "GET", "url": url, "headers": {}}, **extra)
+
+
+def response_received(browser, request_id, timestamp, status=200):
+    browser.send("Network.responseReceived", requestId=request_id, timestamp=timestamp,
+                 response={"status": status, "statusText": "OK", "mimeType": "text/html"})
+
+
+@pytest.fixture
+def capture(tmp_path, monkeypatch):
+    monkeypatch.setattr(capture_module, "NETWORK_REPORT_DIR", str(tmp_path))
+    capture = NetworkCapture()
+    capture.configure({"enabled": True, "max_in_flight": 3, "top_n": 2})
+    return capture
+
+
+def read_har(path):
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)["log"]["entries"]
+
+
+def test_finished_request_becomes_har_entry(capture):
+    browser = FakeBrowser()
+    capture.start_test(browser, "tests/test_x.py::test_x")
+    request_sent(browser, "1", "https://a/", 10.0)
+    response_received(browser, "1", 10.2)
+    browser.send("Network.loadingFinished", requestId="1", timestamp=10.5, encodedDataLength=2048)
+    capture.drain(browser)
+
+    har_path = capture.finish_test(browser, keep=True)
+
+    [entry] = read_har(har_path)
+    assert entry["request"]["url"] == "https://a/"
+    assert entry["response"]["status"] == 200
+    assert entry["time"] == 500.0
+    assert entry["timings"] == {"wait": 200.0, "receive": 300.0}
+    assert entry["_transferSize"] == 2048
+    assert not os.path.exists(har_path.replace(".har", ".entries.jsonl"))
+
+
+def test_redirect_and_failure_are_recorded(capture):
+    browser = FakeBrowser()
+    capture.start_test(browser, "test_redirect")
+    request_sent(browser, "1", "http://a/", 1.0)
+    request_sent(browser, "1", "https://a/", 1.1, redirectResponse={"status": 301})
+    browser.send("Network.loadingFailed", requestId="1", timestamp=1.3, errorText="net::ERR_ABORTED")
+
+    entries = read_har(capture.finish_test(browser, keep=True))
+
+    assert [(e["request"]["url"], e["response"]["status"]) for e in entries] == [("http://a/", 301), ("https://a/", 0)]
+    assert entries[1]["_error"] == "net::ERR_ABORTED"
+
+
+def test_oldest_request_is_evicted_over_max_in_flight(capture):
+    browser = FakeBrowser()
+    capture.start_test(browser, "test_evict")
+    for number in range(4):
+        request_sent(browser, str(number), f"https://a/{number}", float(number))
+    capture.drain(browser)
+
+    assert list(capture._in_flight) == ["1", "2", "3"]
+    entries = read_har(capture.finish_test(browser, keep=True))
+    assert entries[0]["_error"] == "evicted (max_in_flight reached)"
+    assert [e["_error"] for e in entries[1:]] == ["incomplete"] * 3
+
+
+def test_summary_keeps_top_n(capture):
+    browser = FakeBrowser()
+    capture.start_test(browser, "test_top")
+    for number, duration in enumerate((0.1, 0.5, 0.3)):
+        request_sent(browser, str(number), f"https://a/{number}", 1.0)
+        browser.send("Network.loadingFinished", requestId=str(number), timestamp=1.0 + duration,
+                     encodedDataLength=number * 100)
+    capture.drain(browser)
+
+    assert [url for _, _, url in sorted(capture._slowest, reverse=True)] == ["https://a/1", "https://a/2"]
+    assert [url for _, _, url in sorted(capture._largest, reverse=True)] == ["https://a/2", "https://a/1"]
+    capture.finish_test(browser, keep=False)
+
+
+def test_har_is_deleted_when_not_kept(capture, tmp_path):
+    browser = FakeBrowser()
+    capture.start_test(browser, "test_pass")
+    request_sent(browser, "1", "https://a/", 1.0)
+
+    assert capture.finish_test(browser, keep=False) is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_non_chrome_browser_is_skipped(capture):
+    browser = FakeBrowser()
+    browser.name = "firefox"
+    capture.start_test(browser, "test_firefox")
+
+    assert capture.active is False
+    assert capture.capabilities("Firefox") == {}
+    assert "goog:loggingPrefs" in capture.capabilities("Chrome")
@@ -0,0 +1,91 @@
+"""
+Unit tests for utils/page_performance.py (no browser needed).
+
+These tests verify:
+✅ Nearest-rank percentiles
+✅ Budgets per throttling profile and warn-only mode
+✅ Summary grouping per page type, profile and browser target
+✅ A browser that cannot report metrics does not fail the test
+"""
+
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+
+from utils import page_performance as perf
+from utils.stats import percentile
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def recorder(tmp_path, monkeypatch):
+    monkeypatch.setattr(perf, "PERFORMANCE_REPORT_DIR", str(tmp_path))
+    recorder = perf.PagePerformance()
+    recorder.configure({
+        "enabled": True,
+        "budgets": {"results": {"results_visible": 1000}},
+        "profile_budgets": {"3g": {"results": {"results_visible": 5000}}},
+    })
+    recorder.start_test("tests/test_x.py::test_x")
+    return recorder
+
+
+@pytest.mark.parametrize("pct, expected", [(50, 5), (90, 9), (95, 10), (100, 10)])
+def test_percentile_nearest_rank(pct, expected):
+    assert percentile(list(range(10, 0, -1)), pct) == expected
+
+
+def test_percentile_single_value():
+    assert percentile([42], 95) == 42
+
+
+def test_budget_exceeded_only_warns_by_default(recorder):
+    recorder._record("results", {"results_visible": 1500})
+    assert recorder.violations == ["results.results_visible = 1500ms exceeds budget of 1000ms"]
+
+
+def test_budget_exceeded_fails_with_fail_on_budget(recorder):
+    recorder.fail_on_budget = True
+    with pytest.raises(AssertionError, match="results_visible"):
+        recorder._record("results", {"results_visible": 1500})
+
+
+def test_throttle_profile_uses_its_own_budgets(recorder):
+    recorder.throttle_profile = "3g"
+    recorder._record("results", {"results_visible": 4000})
+    assert recorder.violations == []
+    recorder._record("results", {"results_visible": 6000})
+    assert len(recorder.violations) == 1 and "(throttle profile 3g)" in recorder.violations[0]
+
+
+def test_throttle_profile_without_budgets_is_not_checked(recorder):
+    recorder.throttle_profile = "cpu-4x"
+    recorder._record("results", {"results_visible": 60000})
+    assert recorder.violations == []
+
+
+def test_summarize_groups_by_profile_and_browser_target(recorder):
+    recorder._record("search", {"load_event_end": 100})
+    recorder.throttle_profile = "3g"
+    recorder._record("search", {"load_event_end": 300})
+    recorder.browser_target = "firefox"
+    recorder._record("search", {"load_event_end": 500})
+
+    summary = perf.summarize()
+
+    assert set(summary) == {"search", "search [3g]", "firefox/search [3g]"}
+    assert summary["search"]["load_event_end"] == {"count": 1, "p50": 100, "p90": 100, "p95": 100}
+
+
+class FailingBrowser:
+    def execute_async_script(self, script, *args):
+        raise TimeoutException("script timeout")
+
+    def execute_script(self, script, *args):
+        raise JavascriptException("performance is not defined")
+
+
+def test_capture_and_mark_errors_only_warn(recorder):
+    assert recorder.capture(FailingBrowser(), "results") is None
+    assert recorder.mark(FailingBrowser(), "results", "results_visible") is None
+    assert recorder.samples == []
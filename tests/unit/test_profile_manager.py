@@ -0,0 +1,104 @@
+"""
+Unit tests for utils/profile_manager.py (no browser needed).
+
+These tests verify:
+✅ The template is built once and cloned without profile lock files
+✅ The template build is a startup phase, not the session launch
+✅ Clones and the run folder are removed on cleanup
+"""
+
+import os
+
+import pytest
+
+from utils import driver_factory
+from utils import profile_manager as profile_module
+from utils.profile_manager import ProfileManager
+
+pytestmark = pytest.mark.unit
+
+CONFIG = {"browser": "Chrome", "base_url": "http://127.0.0.1/index.html", "implicit_wait": 1}
+
+
+class FakeDriver:
+    """Writes a cache entry and a profile lock into its profile, like a real browser."""
+
+    def __init__(self, profile_dir):
+        self.profile_dir = profile_dir
+
+    def get(self, url):
+        os.makedirs(os.path.join(self.profile_dir, "Default", "Cache"), exist_ok=True)
+        with open(os.path.join(self.profile_dir, "Default", "Cache", "entry"), 'w') as file:
+            file.write(url)
+        open(os.path.join(self.profile_dir, "SingletonLock"), 'w').close()
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def builds(tmp_path, monkeypatch):
+    builds = []
+
+    def fake_create_driver(config, preset_name=None, extra_capabilities=None, profile_dir=None, record_launch=True):
+        builds.append((preset_name, record_launch))
+        return FakeDriver(profile_dir)
+
+    monkeypatch.setattr(profile_module, "PROFILE_ROOT", str(tmp_path))
+    monkeypatch.setattr(driver_factory, "create_driver", fake_create_driver)
+    monkeypatch.setattr(driver_factory, "_startup", dict(driver_factory._startup, phases={}, launches=[]))
+    monkeypatch.delenv("GRID_URL", raising=False)
+    return builds
+
+
+def manager(run_id="run1", **settings):
+    manager = ProfileManager()
+    manager.run_id = run_id
+    manager.configure(dict({"enabled": True}, **settings))
+    return manager
+
+
+@pytest.mark.parametrize("strategy", ["auto", "hardlink"])
+def test_template_is_built_once_and_cloned(builds, strategy):
+    profiles = manager(clone_strategy=strategy)
+
+    first = profiles.clone(CONFIG)
+    second = profiles.clone(CONFIG)
+
+    assert builds == [("chrome-local", False)]
+    assert first != second
+    for clone in (first, second):
+        assert sorted(os.listdir(clone)) == ["Default"]  # SingletonLock is not copied
+        with open(os.path.join(clone, "Default", "Cache", "entry")) as file:
+            assert file.read() == CONFIG["base_url"]
+
+
+def test_template_build_is_a_startup_phase(builds):
+    manager().clone(CONFIG)
+
+    assert "profile_template:chrome-local" in driver_factory._startup["phases"]
+    assert driver_factory._startup["launches"] == []
+
+
+def test_other_worker_reuses_the_template(builds):
+    manager(run_id="shared").clone(CONFIG)
+    assert manager(run_id="shared").clone(CONFIG) is not None
+    assert len(builds) == 1
+
+
+def test_release_and_remove_run(builds):
+    profiles = manager()
+    clone = profiles.clone(CONFIG)
+
+    profiles.release(clone)
+    assert not os.path.exists(clone)
+
+    profiles.remove_run()
+    assert not os.path.exists(profiles.run_dir)
+
+
+def test_no_clone_for_grid_or_disabled(builds, monkeypatch):
+    assert manager(enabled=False).clone(CONFIG) is None
+    monkeypatch.setenv("GRID_URL", "http://localhost:4444/wd/hub")
+    assert manager().clone(CONFIG) is None
+    assert builds == []
@@ -0,0 +1,67 @@
+"""
+Unit tests for utils/state_recorder.py (no browser needed).
+
+These tests verify:
+✅ Only the outermost Allure step records a page state
+✅ The ring buffer keeps the last `capacity` states
+"""
+
+import allure
+import allure_commons
+import pytest
+
+from utils.state_recorder import StateRecorder
+
+pytestmark = pytest.mark.unit
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.calls = []
+        self.script_args = []
+
+    def execute_script(self, script, *args):
+        self.calls.append("execute_script")
+        self.script_args.append(args)
+        return ["https://duckduckgo.com/?q=panda", "panda at DuckDuckGo", "<html></html>" if args[0] else None]
+
+    def get_screenshot_as_png(self):
+        self.calls.append("screenshot")
+        return b"png"
+
+
+@pytest.fixture
+def recorder():
+    recorder = StateRecorder()
+    recorder.configure({"enabled": True, "capacity": 2})
+    allure_commons.plugin_manager.register(recorder)
+    yield recorder
+    allure_commons.plugin_manager.unregister(recorder)
+
+
+def test_nested_steps_record_one_state(recorder):
+    browser = FakeBrowser()
+    recorder.start_test(browser)
+
+    with allure.step("Wait for search results to load"):
+        with allure.step("Wait for element visible"):
+            pass
+
+    assert [state["step"] for state in recorder.states] == ["Wait for search results to load"]
+    assert browser.calls == ["execute_script"]  # screenshots are off by default
+    assert browser.script_args == [(0,)]  # and so is the DOM
+    assert recorder.states[0]["dom"] is None
+
+
+def test_failed_step_is_marked_and_buffer_is_bounded(recorder):
+    recorder.start_test(FakeBrowser())
+
+    for title in ("Load", "Search"):
+        with allure.step(title):
+            pass
+    with pytest.raises(AssertionError):
+        with allure.step("Get all visible search result titles"):
+            raise AssertionError("No visible search result titles found.")
+
+    assert [(state["step"], state["failed"]) for state in recorder.states] == [
+        ("Search", False), ("Get all visible search result titles", True)]
@@ -0,0 +1,183 @@
+"""
+browser_watchdog.py
+===================
+
+This module keeps long session-scoped runs inside their memory limits.
+
+`BrowserSession` owns the WebDriver used by the `browser` fixture and can
+replace it with a fresh one (`recycle`). Every driver gets its own clone of
+the warmed template profile, deleted again when the driver quits. `BrowserWatchdog` samples the browser
+between tests and tells the fixture when to recycle:
+
+- local runs: RSS and CPU of the driver process tree (needs `psutil`)
+- every run: JS heap size from `performance.memory` (Chrome), or CDP
+  `Performance.getMetrics` on local Chrome (Remote sessions have no
+  `execute_cdp_cmd`, so they rely on `performance.memory`)
+- a maximum number of tests per browser session
+- liveness: a browser that no longer answers (crashed, "invalid session id",
+  or its driver process killed) is always recycled
+
+Configuration (config.json):
+----------------------------
+"watchdog": {
+  "enabled": true,
+  "max_tests_per_session": 50,
+  "max_rss_mb": 800,
+  "max_cpu_percent": null,
+  "max_js_heap_mb": 512
+}
+"""
+
+from utils import driver_factory
+from utils.profile_manager import profile_manager
+
+_MB = 1024 * 1024
+
+_JS_HEAP_JS = "return window.performance && performance.memory ? performance.memory.usedJSHeapSize : null;"
+
+
+def _import_psutil():
+    # Imported on first use so conftest does not pay for it at import time
+    try:
+        import psutil
+    except ImportError:  # optional: RSS/CPU sampling is skipped without it
+        return None
+    return psutil
+
+
+class BrowserSession:
+    """Holds the current driver and replaces it on request."""
+
+    def __init__(self, config, extra_capabilities=None):
+        self.config = config
+        self.extra_capabilities = extra_capabilities
+        self.driver = None
+        self.profile_dir = None
+        self.recycle_count = 0
+
+    def start(self):
+        self.profile_dir = profile_manager.clone(self.config)
+        try:
+            self.driver = driver_factory.create_driver(self.config, extra_capabilities=self.extra_capabilities,
+                                                       profile_dir=self.profile_dir)
+        except Exception:
+            self._release_profile()
+            raise
+        return self.driver
+
+    def quit(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                print(f"⚠️ Error while quitting browser: {e}")
+            self.driver = None
+        self._release_profile()
+
+    def _release_profile(self):
+        profile_manager.release(self.profile_dir)
+        self.profile_dir = None
+
+    def recycle(self, reason):
+        """Quits the current browser and starts a new one."""
+        self.recycle_count += 1
+        print(f"♻️ Recycling browser session #{self.recycle_count}: {reason}")
+        self.quit()
+        return self.start()
+
+
+class BrowserWatchdog:
+    """Samples browser resources between tests and decides when to recycle."""
+
+    def __init__(self, settings):
+        self.enabled = settings.get('enabled', False)
+        self.max_tests = settings.get('max_tests_per_session')
+        self.max_rss_mb = settings.get('max_rss_mb')
+        self.max_cpu_percent = settings.get('max_cpu_percent')
+        self.max_js_heap_mb = settings.get('max_js_heap_mb')
+        self.tests_in_session = 0
+        self._processes = {}
+        self._psutil = None
+        if self.enabled and (self.max_rss_mb or self.max_cpu_percent):
+            self._psutil = _import_psutil()
+            if self._psutil is None:
+                print("⚠️ psutil is not installed; browser RSS/CPU limits are not checked.")
+
+    def sample(self, driver):
+        """
+        Reads the current resource usage of the browser.
+
+        :return: {"rss_mb": float|None, "cpu_percent": float|None, "js_heap_mb": float|None}
+        :raises Exception: If the browser or its driver process does not answer.
+        """
+        rss_mb, cpu_percent = self._sample_process_tree(driver)
+        return {"rss_mb": rss_mb, "cpu_percent": cpu_percent, "js_heap_mb": self._sample_js_heap(driver)}
+
+    def check(self, driver):
+        """
+        Called before each test.
+
+        :return: Reason to recycle the browser, or None to keep it.
+        """
+        if not self.enabled:
+            return None
+        if self.max_tests and self.tests_in_session >= self.max_tests:
+            return f"{self.tests_in_session} tests run (max_tests_per_session={self.max_tests})"
+
+        try:
+            usage = self.sample(driver)
+        except Exception as e:
+            # WebDriverException for a crashed browser; urllib3/connection errors when the driver process is gone
+            message = (getattr(e, "msg", None) or str(e) or type(e).__name__).splitlines()[0]
+            return f"browser is not responding ({message})"
+        limits = (("rss_mb", self.max_rss_mb, "MB RSS"),
+                  ("cpu_percent", self.max_cpu_percent, "% CPU"),
+                  ("js_heap_mb", self.max_js_heap_mb, "MB JS heap"))
+        for key, limit, unit in limits:
+            value = usage[key]
+            if limit and value is not None and value > limit:
+                return f"{value:.0f}{unit} exceeds limit of {limit}{unit}"
+        return None
+
+    def test_started(self):
+        self.tests_in_session += 1
+
+    def session_recycled(self):
+        self.tests_in_session = 0
+        self._processes = {}
+
+    def _sample_process_tree(self, driver):
+        service = getattr(driver, "service", None)
+        process = getattr(service, "process", None)
+        psutil = self._psutil
+        if psutil is None or process is None:
+            return None, None  # Remote session, psutil missing or no process limits
+        try:
+            root = psutil.Process(process.pid)
+            tree = [root] + root.children(recursive=True)
+            rss = 0
+            cpu = 0.0
+            current = {}
+            for proc in tree:
+                # Reuse Process objects so cpu_percent() measures since the last sample
+                proc = self._processes.get(proc.pid, proc)
+                current[proc.pid] = proc
+                rss += proc.memory_info().rss
+                cpu += proc.cpu_percent(interval=None)
+            self._processes = current
+            return rss / _MB, cpu
+        except psutil.Error:
+            return None, None
+
+    @staticmethod
+    def _sample_js_heap(driver):
+        # Doubles as the liveness probe: a dead browser or driver process raises here
+        used = driver.execute_script(_JS_HEAP_JS)
+        if used is None and hasattr(driver, "execute_cdp_cmd"):
+            try:
+                driver.execute_cdp_cmd("Performance.enable", {})
+                metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+                used = next((m["value"] for m in metrics if m["name"] == "JSHeapUsedSize"), None)
+            except Exception:
+                return None
+        return used / _MB if used is not None else None
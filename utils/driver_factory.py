@@ -0,0 +1,299 @@
+"""
+driver_factory.py
+=================
+
+This module builds WebDriver sessions for the `browser` fixture.
+
+Backends (local Chrome, local Firefox, Remote/Grid) are registered by name and
+import Selenium and webdriver_manager only when they are used, so a worker that
+runs Chrome locally never imports the Firefox service, GeckoDriverManager or
+`requests`.
+
+Browser options are declared as data in `config/browser_presets.json`.
+The preset is picked from `config.json` (`"preset"`), or defaults to
+`<browser>-local` / `<browser>-grid`. A browser matrix (`"browser_matrix"` or
+`--browser-matrix`) lists several browser/preset targets for one run.
+Local presets with `"profile_template"` start from a clone of a warmed
+profile (utils/profile_manager.py).
+
+Every launch is timed. `report_startup()` prints the per-worker startup cost
+and compares it with `startup_budget_seconds` from `config.json`.
+
+Typical usage:
+--------------
+from utils.driver_factory import create_driver
+
+driver = create_driver(config)
+"""
+
+import importlib
+import json
+import os
+import time
+from functools import lru_cache
+
+from utils.file_utils import FileUtils
+
+PRESETS_FILE = 'config/browser_presets.json'
+STARTUP_REPORT_DIR = os.path.join(os.getcwd(), "reports", "startup")
+DEFAULT_STARTUP_BUDGET_SECONDS = 30
+
+# Options class for each browser, imported only when the preset is built
+_OPTIONS_CLASSES = {
+    "Chrome": ("selenium.webdriver.chrome.options", "Options"),
+    "Firefox": ("selenium.webdriver.firefox.options", "Options"),
+}
+
+_BACKENDS = {}
+
+_startup = {
+    "worker": os.getenv("PYTEST_XDIST_WORKER", "main"),
+    "budget_seconds": DEFAULT_STARTUP_BUDGET_SECONDS,
+    "phases": {},
+    "launches": [],
+}
+
+
+# -----------------------------------------------------------------------------
+# BACKEND REGISTRY
+# -----------------------------------------------------------------------------
+def register_backend(name):
+    """
+    Registers a driver builder under `name`.
+    The builder is called as `builder(options, grid_url)` and returns a WebDriver.
+    """
+    def decorator(builder):
+        _BACKENDS[name] = builder
+        return builder
+    return decorator
+
+
+@lru_cache(maxsize=None)
+def driver_executable(browser_type):
+    """
+    Returns the local driver binary for `browser_type`, downloading it through
+    webdriver_manager on first use. Resolved once per process; call it before
+    starting drivers from several threads so they don't all download at once.
+    """
+    if browser_type == "Firefox":
+        from webdriver_manager.firefox import GeckoDriverManager
+        return GeckoDriverManager().install()
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+@register_backend("chrome")
+def _build_local_chrome(options, grid_url):
+    from selenium.webdriver import Chrome
+    from selenium.webdriver.chrome.service import Service as ChromeService
+
+    service = ChromeService(driver_executable("Chrome"))
+    return Chrome(service=service, options=options)
+
+
+@register_backend("firefox")
+def _build_local_firefox(options, grid_url):
+    from selenium.webdriver import Firefox
+    from selenium.webdriver.firefox.service import Service as FirefoxService
+
+    service = FirefoxService(driver_executable("Firefox"))
+    return Firefox(service=service, options=options)
+
+
+@register_backend("remote")
+def _build_remote(options, grid_url, attempts=3):
+    from selenium.webdriver import Remote
+
+    wait_for_grid(grid_url)
+    # Retry browser creation
+    for attempt in range(attempts):
+        try:
+            print(f"🔄 Attempt {attempt + 1}: Starting browser session...")
+            driver = Remote(command_executor=grid_url, options=options)
+            print("✅ Browser session started successfully.")
+            return driver
+        except Exception as e:
+            print(f"⚠️ Attempt {attempt + 1}: Browser failed to start - {e}")
+            if attempt < attempts - 1:
+                print("⏳ Retrying in 5 seconds...")
+                time.sleep(5)
+            else:
+                print("❌ All attempts to start browser failed.")
+                raise
+
+
+# -----------------------------------------------------------------------------
+# HELPER: Check Selenium Grid Readiness
+# -----------------------------------------------------------------------------
+def wait_for_grid(grid_url, timeout=60):
+    import requests
+
+    print(f"⏳ Waiting for Selenium Grid to be ready at {grid_url} ...")
+    start_time = time.time()
+    while time.time() - start_time < timeout:
+        try:
+            resp = requests.get(f"{grid_url}/status", timeout=5)
+            if resp.ok and "ready" in resp.text:
+                print("✅ Selenium Grid is ready.")
+                return True
+        except requests.exceptions.RequestException:
+            pass
+        print("🔄 Grid not ready yet. Retrying in 5 seconds...")
+        time.sleep(5)
+    raise RuntimeError(f"❌ Timeout: Selenium Grid was not ready after {timeout} seconds.")
+
+
+# -----------------------------------------------------------------------------
+# PRESETS
+# -----------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def load_presets():
+    """Reads the option presets once per process."""
+    return FileUtils.read_json(PRESETS_FILE)
+
+
+def resolve_preset(config, is_grid, preset_name=None):
+    """
+    Picks the preset for this run.
+
+    :param config: Parsed config.json.
+    :param is_grid: True when running against Selenium Grid.
+    :param preset_name: Explicit preset name, overrides config.json.
+    :return: (preset_name, preset dict)
+    :raises ValueError: If the preset is unknown or does not match the browser.
+    """
+    browser_type = config['browser']
+    name = preset_name or config.get('preset') or \
+        f"{browser_type.lower()}-{'grid' if is_grid else 'local'}"
+    presets = load_presets()
+    if name not in presets:
+        raise ValueError(f"Unknown browser preset: {name}")
+    preset = presets[name]
+    if preset['browser'] != browser_type:
+        raise ValueError(f"Preset '{name}' is for {preset['browser']}, not {browser_type}")
+    return name, preset
+
+
+def parse_browser_matrix(entries):
+    """
+    Parses browser matrix entries such as "Chrome" or "Firefox:firefox-grid".
+
+    :param entries: List of "<browser>[:<preset>]" strings.
+    :return: List of {"id", "browser", "preset"} dicts; the id names the target in reports.
+    :raises ValueError: If a browser or preset is unknown, or a preset does not match its browser.
+    """
+    targets = []
+    for entry in entries:
+        browser_type, _, preset_name = entry.strip().partition(":")
+        if browser_type not in _OPTIONS_CLASSES:
+            raise ValueError(f"Unsupported browser in matrix: {browser_type}")
+        if preset_name:
+            resolve_preset({"browser": browser_type}, is_grid=False, preset_name=preset_name)
+        targets.append({
+            "id": preset_name or browser_type.lower(),
+            "browser": browser_type,
+            "preset": preset_name or None,
+        })
+    ids = [target["id"] for target in targets]
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"Duplicate entries in browser matrix: {', '.join(ids)}")
+    return targets
+
+
+def build_options(preset, extra_capabilities=None, profile_dir=None):
+    """
+    Creates a Selenium options object from a preset.
+
+    :param preset: Preset dict from browser_presets.json.
+    :param extra_capabilities: Capabilities added on top of the preset (e.g. logging prefs).
+    :param profile_dir: Existing profile folder to start the browser with (see utils/profile_manager.py).
+    """
+    module_name, class_name = _OPTIONS_CLASSES[preset['browser']]
+    options = getattr(importlib.import_module(module_name), class_name)()
+    for argument in preset.get('arguments', []):
+        options.add_argument(argument)
+    preferences = preset.get('preferences', {})
+    if preferences and preset['browser'] == 'Firefox':
+        for key, value in preferences.items():
+            options.set_preference(key, value)
+    elif preferences:
+        options.add_experimental_option('prefs', preferences)
+    capabilities = dict(preset.get('capabilities', {}), **(extra_capabilities or {}))
+    for key, value in capabilities.items():
+        options.set_capability(key, value)
+    if profile_dir and preset['browser'] == 'Firefox':
+        # geckodriver uses a profile passed as an argument in place instead of copying it
+        options.add_argument("-profile")
+        options.add_argument(profile_dir)
+    elif profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    return options
+
+
+# -----------------------------------------------------------------------------
+# DRIVER CREATION
+# -----------------------------------------------------------------------------
+def create_driver(config, preset_name=None, extra_capabilities=None, profile_dir=None, record_launch=True):
+    """
+    Starts a WebDriver session for the configured browser and backend.
+
+    :param config: Parsed config.json.
+    :param preset_name: Optional preset override.
+    :param extra_capabilities: Capabilities added on top of the preset.
+    :param profile_dir: Profile folder for the browser; None lets the browser create a temporary one.
+    :param record_launch: False for helper launches (e.g. profile template builds) that
+                          must not count as this worker's session startup.
+    :return: WebDriver with implicit wait applied and window maximized.
+    """
+    grid_url = os.getenv("GRID_URL", "")
+    is_grid = bool(grid_url)
+    print(f"🌐 Running on {'Selenium Grid' if is_grid else 'Local WebDriver'}")
+
+    _startup["budget_seconds"] = config.get('startup_budget_seconds', DEFAULT_STARTUP_BUDGET_SECONDS)
+    name, preset = resolve_preset(config, is_grid, preset_name)
+    backend = "remote" if is_grid else preset['browser'].lower()
+
+    started = time.perf_counter()
+    driver = _BACKENDS[backend](build_options(preset, extra_capabilities, profile_dir), grid_url)
+    driver.implicitly_wait(config['implicit_wait'])
+    driver.maximize_window()
+    elapsed = time.perf_counter() - started
+
+    if record_launch:
+        _startup["launches"].append({"preset": name, "backend": backend, "seconds": round(elapsed, 3)})
+    print(f"⏱ Browser '{name}' ({backend}) started in {elapsed:.2f}s")
+    return driver
+
+
+# -----------------------------------------------------------------------------
+# STARTUP BUDGET
+# -----------------------------------------------------------------------------
+def record_startup_phase(name, seconds):
+    """Records a named startup phase (e.g. conftest import) for this worker."""
+    _startup["phases"][name] = round(seconds, 3)
+
+
+def report_startup():
+    """
+    Prints the startup cost of this worker and writes it to reports/startup/.
+    Startup cost = recorded phases + the first browser launch.
+
+    :return: The report as a dictionary, or None if no browser was launched.
+    """
+    if not _startup["launches"]:
+        return None
+    first_launch = _startup["launches"][0]["seconds"]
+    total = sum(_startup["phases"].values()) + first_launch
+    report = dict(_startup, total_seconds=round(total, 3),
+                  within_budget=total <= _startup["budget_seconds"])
+
+    status = "✅" if report["within_budget"] else "⚠️"
+    print(f"\n{status} Worker {report['worker']} startup: {total:.2f}s "
+          f"(budget {report['budget_seconds']}s, phases {report['phases']}, "
+          f"launches {len(report['launches'])})")
+
+    os.makedirs(STARTUP_REPORT_DIR, exist_ok=True)
+    report_path = os.path.join(STARTUP_REPORT_DIR, f"startup_{report['worker']}.json")
+    with open(report_path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    return report
@@ -0,0 +1,157 @@
+"""
+html_snapshot.py
+================
+
+This module evaluates the existing `(By, value)` locators against a captured
+`page_source` instead of the live browser.
+
+In snapshot mode, page objects wait for a ready locator, capture the HTML
+once and answer assertions such as result counts and titles from that
+snapshot with lxml. The browser is free for the next step right away, and the
+cost of an assertion no longer depends on WebDriver round trips.
+
+Limitations: a snapshot only sees the serialized DOM. JS-set input values
+(`.value`) and CSS-class based hiding are not visible in it, so
+`is_displayed()` and `text` only honour `hidden`, inline `display:none` /
+`visibility:hidden` and non-rendered tags.
+
+lxml and cssselect are optional and only imported once snapshot mode is used.
+
+Configuration (config.json):
+----------------------------
+"snapshot_assertions": {
+  "enabled": false
+}
+
+Typical usage:
+--------------
+snapshot = PageSnapshot(browser.page_source)
+count = len(snapshot.find_elements(Loc.RESULT_TITLES))
+"""
+
+_NOT_RENDERED_TAGS = {"head", "script", "style", "template", "noscript"}
+
+
+class SnapshotMode:
+    """Settings for snapshot assertions, applied from config.json."""
+
+    def __init__(self):
+        self.enabled = False
+
+    def configure(self, settings):
+        self.enabled = settings.get('enabled', False)
+        if not self.enabled:
+            return
+        try:
+            import cssselect
+            import lxml.html
+        except ImportError:  # optional: snapshot mode needs lxml + cssselect
+            print("⚠️ lxml/cssselect are not installed; snapshot assertions are disabled.")
+            self.enabled = False
+
+
+def locator_to_xpath(locator):
+    """
+    Converts a Selenium `(By, value)` tuple into an XPath expression.
+
+    :raises ValueError: For locator strategies a static snapshot cannot evaluate.
+    """
+    by, value = locator
+    if by == "xpath":
+        return value
+    if by in ("css selector", "class name"):
+        from cssselect import GenericTranslator
+
+        return GenericTranslator().css_to_xpath(value if by == "css selector" else f".{value}")
+    if by == "id":
+        return f"//*[@id={_xpath_literal(value)}]"
+    if by == "name":
+        return f"//*[@name={_xpath_literal(value)}]"
+    if by == "tag name":
+        return f"//{value}"
+    if by == "link text":
+        return f"//a[normalize-space(.)={_xpath_literal(value)}]"
+    if by == "partial link text":
+        return f"//a[contains(., {_xpath_literal(value)})]"
+    raise ValueError(f"Unsupported locator strategy for snapshots: {by}")
+
+
+def _xpath_literal(value):
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+def _is_rendered(node):
+    """Checks the node itself (not its ancestors) for the hiding a snapshot can see."""
+    if node.tag in _NOT_RENDERED_TAGS or node.get("hidden") is not None:
+        return False
+    if node.tag == "input" and (node.get("type") or "").lower() == "hidden":
+        return False
+    style = (node.get("style") or "").replace(" ", "").lower()
+    return "display:none" not in style and "visibility:hidden" not in style
+
+
+def _rendered_text(node):
+    # Like WebElement.text: text of hidden descendants is left out, their tail text is not
+    parts = [node.text or ""]
+    for child in node:
+        if child.tag == "br":
+            parts.append(" ")
+        elif isinstance(child.tag, str) and _is_rendered(child):  # comments have a non-str tag
+            parts.append(_rendered_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+class SnapshotElement:
+    """Read-only stand-in for a WebElement found in a snapshot."""
+
+    def __init__(self, node):
+        self._node = node
+
+    @property
+    def text(self):
+        return " ".join(_rendered_text(self._node).split()) if self.is_displayed() else ""
+
+    @property
+    def tag_name(self):
+        return self._node.tag
+
+    def get_attribute(self, name):
+        return self._node.get(name)
+
+    def is_displayed(self):
+        return all(_is_rendered(current) for current in [self._node] + list(self._node.iterancestors()))
+
+
+class PageSnapshot:
+    """Parsed copy of the page HTML that answers locator queries."""
+
+    def __init__(self, page_source):
+        from lxml import html as lxml_html
+
+        self.page_source = page_source
+        self._tree = lxml_html.fromstring(page_source)
+
+    def find_elements(self, locator):
+        return [SnapshotElement(node) for node in self._tree.xpath(locator_to_xpath(locator))
+                if hasattr(node, "tag")]
+
+    def find_element(self, locator):
+        from selenium.common.exceptions import NoSuchElementException
+
+        elements = self.find_elements(locator)
+        if not elements:
+            raise NoSuchElementException(f"{locator} not found in page snapshot")
+        return elements[0]
+
+    def visible_texts(self, locator):
+        """Texts of the matching elements that look displayed."""
+        return [element.text for element in self.find_elements(locator) if element.is_displayed()]
+
+
+snapshot_mode = SnapshotMode()
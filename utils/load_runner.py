@@ -0,0 +1,255 @@
+"""
+load_runner.py
+==============
+
+This module runs the page objects as a UI-level load test.
+
+Every virtual user is a thread with its own headless browser (built by
+driver_factory from the configured preset). Users are started linearly over
+the ramp-up period and repeat the search scenario until the duration ends:
+
+  load            DuckDuckGoSearchPage.load()
+  type            DuckDuckGoSearchPage.search(phrase)
+  results_visible DuckDuckGoSearchPage.search_result_wait() + DuckDuckGoResultPage.result_link_titles()
+  click_through   DuckDuckGoResultPage.click_first_result()
+
+Each step sample is streamed to a CSV file as it happens, and a JSON line
+with throughput, per-step percentiles and error rates is written every
+`--interval` seconds. A summary is printed and saved at the end.
+
+Typical usage:
+--------------
+# Local stand-in server
+python -m http.server 8000 --directory benchmarks/fixture_pages
+
+python -m utils.load_runner --users 5 --ramp-up 30 --duration 120 \\
+    --base-url http://127.0.0.1:8000/index.html
+"""
+
+import argparse
+import csv
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from utils import driver_factory
+from utils.file_utils import FileUtils
+from utils.stats import percentile
+
+LOAD_REPORT_DIR = os.path.join(os.getcwd(), "reports", "load")
+STEPS = ("load", "type", "results_visible", "click_through")
+
+
+def _step_stats(latencies, errors):
+    total = len(latencies) + errors
+    stats = {"count": total, "errors": errors, "error_rate": round(errors / total, 4) if total else 0.0}
+    if latencies:
+        stats.update({f"p{pct}": round(percentile(latencies, pct), 1) for pct in (50, 90, 95, 99)})
+    return stats
+
+
+class LoadResults:
+    """Thread-safe sink: streams samples to CSV and aggregates per interval and per run."""
+
+    def __init__(self, output_dir):
+        stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        os.makedirs(output_dir, exist_ok=True)
+        self.samples_path = os.path.join(output_dir, f"samples_{stamp}.csv")
+        self.timeseries_path = os.path.join(output_dir, f"timeseries_{stamp}.jsonl")
+        self.summary_path = os.path.join(output_dir, f"summary_{stamp}.json")
+        self.started = time.time()
+        self.active_users = 0
+        self._lock = threading.Lock()
+        self._samples_file = open(self.samples_path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._samples_file)
+        self._writer.writerow(["timestamp", "user", "iteration", "step", "latency_ms", "ok", "error"])
+        self._timeseries_file = open(self.timeseries_path, 'w', encoding='utf-8')
+        self._run = self._empty_bucket()
+        self._window = self._empty_bucket()
+
+    @staticmethod
+    def _empty_bucket():
+        return {"latencies": {step: [] for step in STEPS}, "errors": {step: 0 for step in STEPS}, "iterations": 0}
+
+    def record(self, user, iteration, step, latency_ms, error=None):
+        with self._lock:
+            self._writer.writerow([round(time.time(), 3), user, iteration, step,
+                                   round(latency_ms, 1), error is None, error or ""])
+            for bucket in (self._run, self._window):
+                if error is None:
+                    bucket["latencies"][step].append(latency_ms)
+                else:
+                    bucket["errors"][step] += 1
+
+    def iteration_done(self):
+        with self._lock:
+            self._run["iterations"] += 1
+            self._window["iterations"] += 1
+
+    def user_started(self):
+        with self._lock:
+            self.active_users += 1
+
+    def user_stopped(self):
+        with self._lock:
+            self.active_users -= 1
+
+    def flush_interval(self, seconds):
+        """Writes one time-series point for the last `seconds` and starts a new window."""
+        with self._lock:
+            window, self._window = self._window, self._empty_bucket()
+            point = {
+                "elapsed_s": round(time.time() - self.started, 1),
+                "active_users": self.active_users,
+                "throughput_per_s": round(window["iterations"] / seconds, 3) if seconds else 0.0,
+                "steps": {step: _step_stats(window["latencies"][step], window["errors"][step]) for step in STEPS},
+            }
+            self._timeseries_file.write(json.dumps(point) + "\n")
+            self._timeseries_file.flush()
+            self._samples_file.flush()
+        return point
+
+    def close(self):
+        """Writes the run summary and closes the output files."""
+        elapsed = time.time() - self.started
+        with self._lock:
+            summary = {
+                "duration_s": round(elapsed, 1),
+                "iterations": self._run["iterations"],
+                "throughput_per_s": round(self._run["iterations"] / elapsed, 3) if elapsed else 0.0,
+                "steps": {step: _step_stats(self._run["latencies"][step], self._run["errors"][step])
+                          for step in STEPS},
+            }
+            self._samples_file.close()
+            self._timeseries_file.close()
+        with open(self.summary_path, 'w', encoding='utf-8') as file:
+            json.dump(summary, file, indent=2)
+        return summary
+
+
+def _virtual_user(user, config, phrases, results, stop, think_time):
+    # Imported here so `--help` works without Selenium installed
+    from pages.result import DuckDuckGoResultPage
+    from pages.search import DuckDuckGoSearchPage
+
+    try:
+        browser = driver_factory.create_driver(config)
+    except Exception as e:
+        results.record(user, 0, "load", 0, error=f"browser start failed: {e}")
+        return
+
+    results.user_started()
+    search_page = DuckDuckGoSearchPage(browser, config)
+    result_page = DuckDuckGoResultPage(browser)
+    steps = (
+        ("load", lambda phrase: search_page.load()),
+        ("type", search_page.search),
+        ("results_visible", lambda phrase: (search_page.search_result_wait(), result_page.result_link_titles())),
+        ("click_through", lambda phrase: result_page.click_first_result()),
+    )
+    iteration = 0
+    try:
+        while not stop.is_set():
+            iteration += 1
+            phrase = phrases[(user + iteration) % len(phrases)]
+            for step, action in steps:
+                started = time.perf_counter()
+                try:
+                    action(phrase)
+                except Exception as e:
+                    results.record(user, iteration, step, (time.perf_counter() - started) * 1000,
+                                   error=type(e).__name__)
+                    break
+                results.record(user, iteration, step, (time.perf_counter() - started) * 1000)
+            else:
+                results.iteration_done()
+            stop.wait(think_time)
+    finally:
+        results.user_stopped()
+        browser.quit()
+
+
+def _delayed_user(start_at, user, config, phrases, results, stop, think_time):
+    # Linear ramp-up: each user waits for its start time (or for an early stop)
+    if stop.wait(max(0, start_at - time.time())):
+        return
+    _virtual_user(user, config, phrases, results, stop, think_time)
+
+
+def run_load(config, users, ramp_up, duration, phrases, output_dir=LOAD_REPORT_DIR, interval=5, think_time=0):
+    """
+    Runs the load scenario and returns the run summary.
+
+    :param config: Parsed config.json (base_url may point at a local stand-in server).
+    :param users: Target concurrency.
+    :param ramp_up: Seconds over which users are started, one after another.
+    :param duration: Total run time in seconds, including ramp-up.
+    :param phrases: Search phrases, rotated per user and iteration.
+    """
+    if not os.getenv("GRID_URL"):
+        # Resolve the driver binary once, not concurrently from every user thread
+        driver_factory.driver_executable(config['browser'])
+    results = LoadResults(output_dir)
+    stop = threading.Event()
+    threads = []
+    print(f"🚀 Load run: {users} users, ramp-up {ramp_up}s, duration {duration}s -> {config['base_url']}")
+
+    for user in range(users):
+        start_at = results.started + (ramp_up * user / users if users else 0)
+        thread = threading.Thread(
+            target=_delayed_user,
+            args=(start_at, user, config, phrases, results, stop, think_time),
+            daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+
+    end_at = results.started + duration
+    last_flush = results.started
+    while time.time() < end_at:
+        time.sleep(min(interval, max(0, end_at - time.time())))
+        now = time.time()
+        point = results.flush_interval(now - last_flush)
+        last_flush = now
+        print(f"⏱ {point['elapsed_s']:>7}s users={point['active_users']:<3} "
+              f"throughput={point['throughput_per_s']}/s")
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+    summary = results.close()
+
+    print(f"\n📊 Iterations: {summary['iterations']}  Throughput: {summary['throughput_per_s']}/s")
+    for step, stats in summary["steps"].items():
+        print(f"   {step:<16} n={stats['count']:<6} errors={stats['error_rate']:.1%} "
+              f"p50={stats.get('p50', '-')} p95={stats.get('p95', '-')} p99={stats.get('p99', '-')}")
+    print(f"📁 Samples: {results.samples_path}\n📁 Time series: {results.timeseries_path}")
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the search page objects as a UI load test.")
+    parser.add_argument("--users", type=int, default=2, help="Target number of concurrent browsers")
+    parser.add_argument("--ramp-up", type=float, default=10, help="Seconds to start all users")
+    parser.add_argument("--duration", type=float, default=60, help="Total run time in seconds")
+    parser.add_argument("--base-url", help="Overrides base_url from config.json")
+    parser.add_argument("--config", default="config/config.json", help="Config file to use")
+    parser.add_argument("--phrases", help="Comma-separated search phrases (default: test_data/basic_cases.json)")
+    parser.add_argument("--interval", type=float, default=5, help="Seconds per time-series point")
+    parser.add_argument("--think-time", type=float, default=0, help="Pause between iterations per user")
+    parser.add_argument("--output", default=LOAD_REPORT_DIR, help="Folder for CSV/JSON results")
+    args = parser.parse_args(argv)
+
+    config = FileUtils.read_json(args.config)
+    if args.base_url:
+        config['base_url'] = args.base_url
+    phrases = args.phrases.split(",") if args.phrases else \
+        FileUtils.read_json('test_data/basic_cases.json')['search_phrases']
+    return run_load(config, args.users, args.ramp_up, args.duration, phrases,
+                    output_dir=args.output, interval=args.interval, think_time=args.think_time)
+
+
+if __name__ == "__main__":
+    main()
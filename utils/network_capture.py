@@ -0,0 +1,252 @@
+"""
+network_capture.py
+==================
+
+This module records network requests from the Chrome performance log
+(`goog:loggingPrefs`) and writes them as a HAR-like file per test.
+
+Events are drained from the browser incrementally (at test start, after each
+`BasePage.navigate()` and at test end) and turned into entries as soon as a
+request finishes. Finished entries are appended to a JSONL file on disk, so
+memory only holds requests that are still in flight (capped by
+`max_in_flight`) plus the top slowest/largest entries for the summary.
+
+The HAR file is kept and attached to Allure only when the test fails or
+exceeds a page performance budget; otherwise it is deleted.
+
+Configuration (config.json):
+----------------------------
+"network_capture": {
+  "enabled": false,
+  "max_in_flight": 500,
+  "top_n": 5
+}
+
+Typical usage:
+--------------
+from utils.network_capture import network_capture
+
+network_capture.start_test(browser, nodeid)
+network_capture.drain(browser)
+network_capture.finish_test(browser, keep=failed)
+"""
+
+import heapq
+import json
+import os
+from datetime import datetime, timezone
+
+import allure
+
+NETWORK_REPORT_DIR = os.path.join(os.getcwd(), "reports", "network")
+
+# Chrome capability that turns on DevTools events in the performance log
+PERFORMANCE_LOG_CAPABILITIES = {
+    "goog:loggingPrefs": {"performance": "ALL"},
+}
+
+_NETWORK_EVENTS = (
+    "Network.requestWillBeSent",
+    "Network.responseReceived",
+    "Network.loadingFinished",
+    "Network.loadingFailed",
+)
+
+
+class NetworkCapture:
+    """Streams Chrome network events into a per-test HAR-like file."""
+
+    def __init__(self):
+        self.enabled = False
+        self.max_in_flight = 500
+        self.top_n = 5
+        self.active = False
+        self._in_flight = {}
+        self._entries_file = None
+        self._entries_path = None
+        self._entry_count = 0
+        self._slowest = []
+        self._largest = []
+
+    def configure(self, settings):
+        """Applies the `network_capture` section of config.json."""
+        self.enabled = settings.get('enabled', False)
+        self.max_in_flight = settings.get('max_in_flight', 500)
+        self.top_n = settings.get('top_n', 5)
+
+    def capabilities(self, browser_type):
+        """
+        Extra capabilities the driver needs for capture.
+        Capture needs the Chrome performance log, so other browsers run without it.
+        """
+        if not self.enabled:
+            return {}
+        if browser_type != 'Chrome':
+            print(f"⚠️ Network capture needs the Chrome performance log; skipped for {browser_type}.")
+            return {}
+        return dict(PERFORMANCE_LOG_CAPABILITIES)
+
+    # -------------------------------------------------------------------------
+    # PER-TEST LIFECYCLE
+    # -------------------------------------------------------------------------
+    def start_test(self, browser, nodeid):
+        """Discards events from earlier tests and opens this test's entry file."""
+        if not self.enabled or browser.name != "chrome":
+            return
+        self._read_log(browser)  # drop anything buffered before this test
+        self._in_flight = {}
+        self._slowest = []
+        self._largest = []
+        self._entry_count = 0
+
+        os.makedirs(NETWORK_REPORT_DIR, exist_ok=True)
+        test_name = nodeid.replace("::", "_").replace("/", "_")
+        self._entries_path = os.path.join(NETWORK_REPORT_DIR, f"{test_name}.entries.jsonl")
+        self._entries_file = open(self._entries_path, 'w', encoding='utf-8')
+        self.active = True
+
+    def drain(self, browser):
+        """Pulls buffered events from the browser and writes finished requests."""
+        if not self.active:
+            return
+        for message in self._read_log(browser):
+            self._handle(message)
+
+    def finish_test(self, browser, keep):
+        """
+        Drains the remaining events and closes the entry file.
+
+        :param browser: WebDriver instance.
+        :param keep: True to convert the entries to HAR and attach them (failure or budget exceeded).
+        :return: Path to the HAR file, or None if it was not kept.
+        """
+        if not self.active:
+            return None
+        try:
+            self.drain(browser)
+        except Exception as e:
+            print(f"⚠️ Could not read network events: {e}")
+        for request_id in list(self._in_flight):
+            self._complete(request_id, error="incomplete")
+        self._entries_file.close()
+        self.active = False
+
+        if not keep:
+            os.remove(self._entries_path)
+            return None
+
+        har_path = self._entries_path.replace(".entries.jsonl", ".har")
+        self._write_har(har_path)
+        os.remove(self._entries_path)
+        allure.attach.file(har_path, name="network.har", attachment_type=allure.attachment_type.JSON)
+        allure.attach(self.summary(), name="network_summary", attachment_type=allure.attachment_type.TEXT)
+        print(f"🌐 Network capture saved: {har_path}")
+        return har_path
+
+    def summary(self):
+        """Text summary of the slowest and largest requests of the current test."""
+        lines = [f"Requests captured: {self._entry_count}", "", "Slowest:"]
+        for duration, _, url in sorted(self._slowest, reverse=True):
+            lines.append(f"  {duration:>9.0f} ms  {url}")
+        lines += ["", "Largest:"]
+        for size, _, url in sorted(self._largest, reverse=True):
+            lines.append(f"  {size:>9} B   {url}")
+        return "\n".join(lines)
+
+    # -------------------------------------------------------------------------
+    # EVENT HANDLING
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _read_log(browser):
+        messages = []
+        for entry in browser.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            if message.get("method") in _NETWORK_EVENTS:
+                messages.append(message)
+        return messages
+
+    def _handle(self, message):
+        method = message["method"]
+        params = message["params"]
+        request_id = params.get("requestId")
+
+        if method == "Network.requestWillBeSent":
+            if request_id in self._in_flight and params.get("redirectResponse"):
+                # Same request id is reused for the redirected request
+                self._in_flight[request_id]["response"] = params["redirectResponse"]
+                self._complete(request_id, finished=params["timestamp"])
+            self._in_flight[request_id] = {
+                "request": params["request"],
+                "wall_time": params.get("wallTime"),
+                "started": params["timestamp"],
+            }
+            if len(self._in_flight) > self.max_in_flight:
+                oldest = next(iter(self._in_flight))
+                self._complete(oldest, error="evicted (max_in_flight reached)")
+        elif request_id not in self._in_flight:
+            return
+        elif method == "Network.responseReceived":
+            self._in_flight[request_id]["response"] = params["response"]
+            self._in_flight[request_id]["response_at"] = params["timestamp"]
+        elif method == "Network.loadingFinished":
+            self._complete(request_id, finished=params["timestamp"],
+                           transfer_size=params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed":
+            self._complete(request_id, finished=params["timestamp"],
+                           error=params.get("errorText", "failed"))
+
+    def _complete(self, request_id, finished=None, transfer_size=0, error=None):
+        pending = self._in_flight.pop(request_id)
+        request = pending["request"]
+        response = pending.get("response", {})
+        started = pending["started"]
+        response_at = pending.get("response_at", finished or started)
+        total_ms = ((finished or started) - started) * 1000
+        started_at = datetime.fromtimestamp(pending["wall_time"] or 0, tz=timezone.utc)
+
+        entry = {
+            "startedDateTime": started_at.isoformat(),
+            "time": round(total_ms, 1),
+            "request": {
+                "method": request.get("method"),
+                "url": request.get("url"),
+                "headers": [{"name": k, "value": v} for k, v in request.get("headers", {}).items()],
+            },
+            "response": {
+                "status": response.get("status", 0),
+                "statusText": response.get("statusText", ""),
+                "content": {"mimeType": response.get("mimeType", ""), "size": transfer_size},
+            },
+            "timings": {
+                "wait": round((response_at - started) * 1000, 1),
+                "receive": round(((finished or response_at) - response_at) * 1000, 1),
+            },
+            "_transferSize": transfer_size,
+        }
+        if error:
+            entry["_error"] = error
+
+        self._entries_file.write(json.dumps(entry) + "\n")
+        self._entry_count += 1
+        self._keep_top(self._slowest, (entry["time"], self._entry_count, request.get("url")))
+        self._keep_top(self._largest, (transfer_size, self._entry_count, request.get("url")))
+
+    def _keep_top(self, heap, item):
+        if len(heap) < self.top_n:
+            heapq.heappush(heap, item)
+        else:
+            heapq.heappushpop(heap, item)
+
+    def _write_har(self, har_path):
+        """Streams the JSONL entries into a HAR document without loading them all."""
+        with open(self._entries_path, 'r', encoding='utf-8') as entries, \
+                open(har_path, 'w', encoding='utf-8') as har:
+            har.write('{"log": {"version": "1.2", '
+                      '"creator": {"name": "selenium-pytest-ui-framework", "version": "1.0"}, '
+                      '"entries": [\n')
+            for index, line in enumerate(entries):
+                har.write((",\n" if index else "") + line.rstrip("\n"))
+            har.write("\n]}}\n")
+
+
+network_capture = NetworkCapture()
@@ -0,0 +1,262 @@
+"""
+page_performance.py
+===================
+
+This module collects client-side performance metrics from the browser and
+checks them against budgets from `config.json`.
+
+After a navigation, `capture()` reads Navigation Timing, Paint Timing,
+Largest Contentful Paint and resource counts/bytes in a single
+`execute_async_script` round trip (LCP is only exposed through a buffered
+PerformanceObserver, which reports asynchronously). `mark()` records a
+named point in time, e.g. when search results became visible.
+
+Samples are attached to the Allure report of the running test, streamed to
+`reports/performance/page_metrics_<worker>.jsonl`, and summarized as
+percentiles per page type (and browser, in a matrix run) at the end of the run.
+
+Configuration (config.json):
+----------------------------
+"page_performance": {
+  "enabled": true,
+  "fail_on_budget": false,
+  "budgets": {
+    "search": {"load_event_end": 10000},
+    "results": {"results_visible": 15000}
+  },
+  "profile_budgets": {
+    "3g": {"results": {"results_visible": 45000}}
+  }
+}
+
+`budgets` apply to unthrottled runs. Under a throttling profile only that
+profile's `profile_budgets` are checked; without any, samples are recorded
+but not checked. Exceeded budgets are printed, and fail the step only with
+`fail_on_budget`. A browser that cannot report metrics (e.g. a script timeout
+on a throttled page) only prints a warning.
+
+Typical usage:
+--------------
+from utils.page_performance import page_performance
+
+page_performance.capture(browser, "search")
+page_performance.mark(browser, "results", "results_visible")
+"""
+
+import glob
+import json
+import os
+
+import allure
+from selenium.common.exceptions import WebDriverException
+
+from utils.stats import percentile
+
+PERFORMANCE_REPORT_DIR = os.path.join(os.getcwd(), "reports", "performance")
+PERCENTILES = (50, 90, 95)
+
+_COLLECT_METRICS_JS = """
+var done = arguments[arguments.length - 1];
+var sent = false;
+
+function collect(lcp) {
+    if (sent) { return; }
+    sent = true;
+    var nav = performance.getEntriesByType('navigation')[0];
+    var paints = {};
+    performance.getEntriesByType('paint').forEach(function (entry) {
+        paints[entry.name] = entry.startTime;
+    });
+    var resources = performance.getEntriesByType('resource');
+    var transferBytes = 0;
+    var decodedBytes = 0;
+    resources.forEach(function (entry) {
+        transferBytes += entry.transferSize || 0;
+        decodedBytes += entry.decodedBodySize || 0;
+    });
+    done({
+        url: window.location.href,
+        ttfb: nav ? nav.responseStart : null,
+        dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+        load_event_end: nav ? nav.loadEventEnd : null,
+        first_paint: paints['first-paint'] || null,
+        first_contentful_paint: paints['first-contentful-paint'] || null,
+        largest_contentful_paint: lcp,
+        resource_count: resources.length,
+        resource_transfer_bytes: transferBytes,
+        resource_decoded_bytes: decodedBytes,
+        document_transfer_bytes: nav ? nav.transferSize : null
+    });
+}
+
+function start() {
+    try {
+        new PerformanceObserver(function (list) {
+            var entries = list.getEntries();
+            collect(entries[entries.length - 1].startTime);
+        }).observe({type: 'largest-contentful-paint', buffered: true});
+    } catch (e) {
+        collect(null);  // LCP not supported by this browser
+        return;
+    }
+    // Nothing painted yet: don't hold the step up waiting for an LCP entry
+    setTimeout(function () { collect(null); }, 100);
+}
+
+if (document.readyState === 'complete') {
+    start();
+} else {
+    window.addEventListener('load', function () { setTimeout(start, 0); });
+}
+"""
+
+
+class PagePerformance:
+    """Collects performance samples for the running test and checks budgets."""
+
+    def __init__(self):
+        self.enabled = False
+        self.fail_on_budget = False
+        self.budgets = {}
+        self.profile_budgets = {}
+        self.worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.current_test = None
+        self.throttle_profile = None
+        self.browser_target = None
+        self.samples = []
+        self.violations = []
+
+    def configure(self, settings):
+        """Applies the `page_performance` section of config.json."""
+        self.enabled = settings.get('enabled', False)
+        self.fail_on_budget = settings.get('fail_on_budget', False)
+        self.budgets = settings.get('budgets', {})
+        self.profile_budgets = settings.get('profile_budgets', {})
+
+    def start_test(self, nodeid):
+        self.current_test = nodeid
+        self.throttle_profile = None
+        self.browser_target = None
+        self.samples = []
+        self.violations = []
+
+    def capture(self, browser, page_type):
+        """
+        Collects navigation, paint, LCP and resource metrics for the current document.
+
+        :param browser: WebDriver instance.
+        :param page_type: Page type used for budgets and the summary ("search", "results").
+        :return: The recorded sample, or None if capture is disabled or the browser could not report metrics.
+        """
+        if not self.enabled:
+            return None
+        try:
+            metrics = browser.execute_async_script(_COLLECT_METRICS_JS)
+        except WebDriverException as e:
+            # e.g. a script timeout on a throttled page; metrics must not fail the functional test
+            print(f"⚠️ Could not capture page metrics for '{page_type}': {e.msg or type(e).__name__}")
+            return None
+        return self._record(page_type, metrics)
+
+    def mark(self, browser, page_type, name):
+        """
+        Records milliseconds since navigation start under `name`, e.g. "results_visible".
+
+        :return: The recorded sample, or None if capture is disabled or the browser could not report the time.
+        """
+        if not self.enabled:
+            return None
+        try:
+            elapsed = browser.execute_script("return performance.now();")
+        except WebDriverException as e:
+            print(f"⚠️ Could not record '{name}' for '{page_type}': {e.msg or type(e).__name__}")
+            return None
+        return self._record(page_type, {name: elapsed})
+
+    def _record(self, page_type, metrics):
+        sample = dict(metrics, test=self.current_test, page_type=page_type,
+                      throttle_profile=self.throttle_profile, browser_target=self.browser_target)
+        self.samples.append(sample)
+        self._write(sample)
+        self._check_budgets(page_type, metrics)
+        return sample
+
+    def _write(self, sample):
+        os.makedirs(PERFORMANCE_REPORT_DIR, exist_ok=True)
+        path = os.path.join(PERFORMANCE_REPORT_DIR, f"page_metrics_{self.worker}.jsonl")
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(sample) + "\n")
+
+    def budgets_for(self, page_type):
+        """Budgets that apply to `page_type` under the active throttling profile (if any)."""
+        if self.throttle_profile:
+            return self.profile_budgets.get(self.throttle_profile, {}).get(page_type, {})
+        return self.budgets.get(page_type, {})
+
+    def _check_budgets(self, page_type, metrics):
+        for metric, budget in self.budgets_for(page_type).items():
+            value = metrics.get(metric)
+            if value is None or value <= budget:
+                continue
+            message = f"{page_type}.{metric} = {value:.0f}ms exceeds budget of {budget}ms"
+            if self.throttle_profile:
+                message += f" (throttle profile {self.throttle_profile})"
+            self.violations.append(message)
+            print(f"⚠️ Performance budget exceeded: {message}")
+            if self.fail_on_budget:
+                raise AssertionError(f"❌ Performance budget exceeded: {message}")
+
+    def finish_test(self):
+        """Attaches the samples of the finished test to Allure."""
+        if self.samples:
+            allure.attach(
+                json.dumps(self.samples, indent=2),
+                name="page_performance",
+                attachment_type=allure.attachment_type.JSON
+            )
+        self.current_test = None
+
+
+def reset_reports():
+    """Removes metric files from a previous run. Call once, from the controller."""
+    for path in glob.glob(os.path.join(PERFORMANCE_REPORT_DIR, "page_metrics_*.jsonl")):
+        os.remove(path)
+
+
+def summarize():
+    """
+    Reads every worker's metric file and computes percentiles per page type.
+    Samples taken under a throttling profile are grouped as "<page_type> [<profile>]",
+    and samples from a browser matrix run are prefixed with the target ("firefox/<page_type>").
+
+    :return: {page_type: {metric: {"count": n, "p50": .., "p90": .., "p95": ..}}}
+    """
+    values = {}
+    for path in glob.glob(os.path.join(PERFORMANCE_REPORT_DIR, "page_metrics_*.jsonl")):
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                sample = json.loads(line)
+                group = sample['page_type']
+                if sample.get('throttle_profile'):
+                    group = f"{group} [{sample['throttle_profile']}]"
+                if sample.get('browser_target'):
+                    group = f"{sample['browser_target']}/{group}"
+                metrics = values.setdefault(group, {})
+                for key, value in sample.items():
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        metrics.setdefault(key, []).append(value)
+
+    summary = {}
+    for page_type, metrics in values.items():
+        summary[page_type] = {
+            metric: dict({"count": len(samples)},
+                         **{f"p{pct}": round(percentile(samples, pct), 1) for pct in PERCENTILES})
+            for metric, samples in metrics.items()
+        }
+    if summary:
+        with open(os.path.join(PERFORMANCE_REPORT_DIR, "summary.json"), 'w', encoding='utf-8') as file:
+            json.dump(summary, file, indent=2)
+    return summary
+
+
+page_performance = PagePerformance()
@@ -0,0 +1,228 @@
+"""
+profile_manager.py
+==================
+
+This module gives every local browser session a pre-warmed profile.
+
+Once per run and preset, a template profile is built: the browser starts with
+an empty profile, opens the `warm_urls` (so static assets land in the HTTP
+cache and first-run initialization is done) and quits. xdist workers share
+the template: the first worker to create the lock file builds it, the others
+wait for its `.ready` marker. Templates live under
+`<tmp>/selenium-profiles/<testrunuid>/`, so every run starts from a fresh one.
+
+Each browser session then gets its own clone of the template:
+
+- "auto": copy-on-write reflinks (FICLONE, e.g. btrfs/XFS) where the
+  filesystem supports them, a plain copy otherwise
+- "hardlink": hardlinks the HTTP cache files and copies the rest. Fastest,
+  but cache entries a browser rewrites in place are shared with other clones.
+
+Clones are removed when the session quits, the controller removes the run
+folder at the end of the run, and run folders older than a day (e.g. from a
+killed run) are pruned on the next run.
+
+Configuration (config.json):
+----------------------------
+"profile_templates": {
+  "enabled": true,
+  "clone_strategy": "auto",
+  "warm_urls": [],
+  "build_timeout_seconds": 120
+}
+`warm_urls` defaults to `base_url`. Presets opt in with `"profile_template": true`.
+
+Typical usage:
+--------------
+from utils.profile_manager import profile_manager
+
+profile_dir = profile_manager.clone(config)
+driver = create_driver(config, profile_dir=profile_dir)
+...
+driver.quit()
+profile_manager.release(profile_dir)
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+from utils import driver_factory
+
+try:
+    import fcntl
+except ImportError:  # Windows: no reflinks, clones are plain copies
+    fcntl = None
+
+PROFILE_ROOT = os.path.join(tempfile.gettempdir(), "selenium-profiles")
+STALE_RUN_SECONDS = 24 * 60 * 60
+
+# ioctl request for a copy-on-write clone of a whole file (linux/fs.h)
+_FICLONE = 0x40049409
+
+# Files that mark a profile as in use; a clone must not inherit them
+_PROFILE_LOCKS = {"SingletonLock", "SingletonCookie", "SingletonSocket", "lock", ".parentlock", "parent.lock"}
+
+# HTTP cache folders (Chrome, Firefox) that the "hardlink" strategy links instead of copying
+_CACHE_DIRS = {"Cache", "Code Cache", "cache2", "startupCache"}
+
+
+def _ignore_profile_locks(directory, names):
+    return [name for name in names if name in _PROFILE_LOCKS]
+
+
+class ProfileManager:
+    """Builds one warmed template profile per preset and hands out clones of it."""
+
+    def __init__(self):
+        self.enabled = False
+        self.clone_strategy = "auto"
+        self.warm_urls = []
+        self.build_timeout = 120
+        self.run_id = os.getenv("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+        self.worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.clones = set()
+        self._templates = {}
+        self._reflinks = fcntl is not None
+
+    def configure(self, settings):
+        """Applies the `profile_templates` section of config.json."""
+        self.enabled = settings.get('enabled', False)
+        self.clone_strategy = settings.get('clone_strategy', "auto")
+        self.warm_urls = settings.get('warm_urls', [])
+        self.build_timeout = settings.get('build_timeout_seconds', 120)
+        if self.clone_strategy not in ("auto", "hardlink"):
+            raise ValueError(f"Unknown profile clone strategy: {self.clone_strategy}")
+
+    @property
+    def run_dir(self):
+        return os.path.join(PROFILE_ROOT, self.run_id)
+
+    # -------------------------------------------------------------------------
+    # CLONES
+    # -------------------------------------------------------------------------
+    def clone(self, config, preset_name=None):
+        """
+        Creates a private copy of the warmed template for one browser session.
+
+        :param config: Parsed config.json (browser, preset and base_url are used).
+        :param preset_name: Optional preset override.
+        :return: Path of the cloned profile, or None if the session should use the browser's own temporary profile
+                 (disabled, Selenium Grid, preset without `profile_template`, or the template could not be built).
+        """
+        is_grid = bool(os.getenv("GRID_URL", ""))
+        if not self.enabled or is_grid:
+            return None  # Grid nodes cannot see profiles on this machine
+        name, preset = driver_factory.resolve_preset(config, is_grid, preset_name)
+        if not preset.get('profile_template'):
+            return None
+        template_dir = self._template(config, name)
+        if template_dir is None:
+            return None
+
+        started = time.perf_counter()
+        clone_dir = tempfile.mkdtemp(prefix=f"{name}-{self.worker}-", dir=self.run_dir)
+        shutil.copytree(template_dir, clone_dir, ignore=_ignore_profile_locks,
+                        copy_function=self._copy_file, dirs_exist_ok=True)
+        self.clones.add(clone_dir)
+        print(f"📂 Profile cloned from template '{name}' in {time.perf_counter() - started:.2f}s: {clone_dir}")
+        return clone_dir
+
+    def release(self, profile_dir):
+        """Deletes a clone once its browser has quit."""
+        if profile_dir is None:
+            return
+        shutil.rmtree(profile_dir, ignore_errors=True)
+        self.clones.discard(profile_dir)
+
+    def _copy_file(self, source, target):
+        if self.clone_strategy == "hardlink" and _CACHE_DIRS.intersection(source.split(os.sep)):
+            try:
+                os.link(source, target)
+                return target
+            except OSError:
+                pass  # e.g. different filesystem; copy instead
+        if self._reflinks:
+            try:
+                with open(source, 'rb') as source_file, open(target, 'wb') as target_file:
+                    fcntl.ioctl(target_file.fileno(), _FICLONE, source_file.fileno())
+                shutil.copystat(source, target)
+                return target
+            except OSError:
+                self._reflinks = False  # filesystem without reflinks; stop trying
+        return shutil.copy2(source, target)
+
+    # -------------------------------------------------------------------------
+    # TEMPLATES
+    # -------------------------------------------------------------------------
+    def _template(self, config, name):
+        """Returns the template folder for a preset, building it if this process wins the lock."""
+        if name in self._templates:
+            return self._templates[name]
+
+        os.makedirs(self.run_dir, exist_ok=True)
+        template_dir = os.path.join(self.run_dir, f"template-{name}")
+        try:
+            os.close(os.open(f"{template_dir}.lock", os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            self._wait_for_template(name, template_dir)
+        else:
+            self._build_template(config, name, template_dir)
+
+        self._templates[name] = template_dir if os.path.exists(f"{template_dir}.ready") else None
+        return self._templates[name]
+
+    def _build_template(self, config, name, template_dir):
+        print(f"🔥 Building profile template '{name}'")
+        started = time.perf_counter()
+        os.makedirs(template_dir, exist_ok=True)
+        try:
+            driver = driver_factory.create_driver(config, preset_name=name, profile_dir=template_dir,
+                                                  record_launch=False)
+            try:
+                for url in self.warm_urls or [config['base_url']]:
+                    driver.get(url)
+            finally:
+                driver.quit()
+        except Exception as e:
+            print(f"⚠️ Could not build profile template '{name}'; sessions use a fresh profile: {e}")
+            with open(f"{template_dir}.failed", 'w', encoding='utf-8') as file:
+                file.write(str(e))
+            return
+        open(f"{template_dir}.ready", 'w').close()
+        elapsed = time.perf_counter() - started
+        # Reported as its own startup phase on the worker that built it, not as the session launch
+        driver_factory.record_startup_phase(f"profile_template:{name}", elapsed)
+        print(f"✅ Profile template '{name}' built in {elapsed:.2f}s")
+
+    def _wait_for_template(self, name, template_dir):
+        deadline = time.time() + self.build_timeout
+        while time.time() < deadline:
+            if os.path.exists(f"{template_dir}.ready") or os.path.exists(f"{template_dir}.failed"):
+                return
+            time.sleep(0.5)
+        print(f"⚠️ Profile template '{name}' not ready after {self.build_timeout}s; using a fresh profile.")
+
+    # -------------------------------------------------------------------------
+    # RUN CLEANUP
+    # -------------------------------------------------------------------------
+    def remove_run(self):
+        """Deletes this run's templates and any clones left behind. Call once, from the controller."""
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+        self.clones.clear()
+        self._templates.clear()
+
+    @staticmethod
+    def prune_stale_runs(max_age_seconds=STALE_RUN_SECONDS):
+        """Deletes run folders of earlier runs that were killed before their cleanup."""
+        if not os.path.isdir(PROFILE_ROOT):
+            return
+        cutoff = time.time() - max_age_seconds
+        for entry in os.scandir(PROFILE_ROOT):
+            if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+
+profile_manager = ProfileManager()
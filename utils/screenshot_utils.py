@@ -0,0 +1,56 @@
+"""
+screenshot_utils.py
+===================
+
+This module saves failure screenshots and attaches them to the Allure report.
+It is used by the `pytest_runtest_makereport` hook in conftest.py and by the
+framework benchmarks.
+
+Typical usage:
+--------------
+from utils.screenshot_utils import capture_failure_screenshot
+
+capture_failure_screenshot(browser, report.nodeid)
+"""
+
+import os
+from datetime import datetime
+
+import allure
+
+FAILED_SCREENSHOTS_DIR = os.path.join(os.getcwd(), "reports", "screenshots", "failed")
+
+
+def capture_failure_screenshot(browser, nodeid, directory=FAILED_SCREENSHOTS_DIR):
+    """
+    Saves a screenshot for a failed test and attaches it to Allure.
+
+    :param browser: WebDriver instance.
+    :param nodeid: Pytest node id of the failed test.
+    :param directory: Folder the PNG is written to.
+    :return: Path to the screenshot, or None if it could not be taken.
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    test_name = nodeid.replace("::", "_").replace("/", "_")
+    screenshot_name = f"{test_name}_{timestamp}.png"
+    screenshot_path = os.path.join(directory, screenshot_name)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        browser.save_screenshot(screenshot_path)
+        allure.attach.file(
+            screenshot_path,
+            name=f"{test_name}_FAILED",
+            attachment_type=allure.attachment_type.PNG
+        )
+        print(f"📸 Screenshot saved for FAILED test: {screenshot_path}")
+        return screenshot_path
+    except WebDriverException as e:
+        if "invalid session id" in str(e).lower():
+            print("⚠️ Browser session ended before screenshot could be taken.")
+        else:
+            print(f"⚠️ Could not save screenshot: {e}")
+    except Exception as e:
+        print(f"⚠️ Unexpected error saving screenshot: {e}")
+    return None
@@ -0,0 +1,160 @@
+"""
+state_recorder.py
+=================
+
+This module keeps the last N page states of the running test in memory and
+writes them out only when the test fails.
+
+A state is captured whenever an outermost `@allure.step` finishes (a page
+object method, or a wait_utils helper called directly from a test; helpers
+nested inside a page object step are not captured separately): URL, title,
+an optional trimmed and zlib-compressed DOM, and an optional PNG screenshot.
+States live in a bounded deque, so a passing test costs one small script call
+per top-level step and never touches the disk. The DOM (`dom_chars`) and
+screenshots are off by default: the browser has to serialize the whole
+document to trim it, and both are sent over the wire for every step.
+
+On failure, `flush()` writes the buffered states to
+`reports/screenshots/failed/<test>_steps/` and attaches them to Allure.
+
+Configuration (config.json):
+----------------------------
+"state_recorder": {
+  "enabled": true,
+  "capacity": 10,
+  "screenshots": false,
+  "dom_chars": 0
+}
+"""
+
+import json
+import os
+import time
+import zlib
+from collections import deque
+
+import allure
+import allure_commons
+
+STEPS_REPORT_DIR = os.path.join(os.getcwd(), "reports", "screenshots", "failed")
+
+# URL, title and (if dom_chars > 0) the beginning of the DOM in one round trip
+_STATE_JS = """
+var limit = arguments[0];
+var dom = limit > 0 ? document.documentElement.outerHTML.slice(0, limit) : null;
+return [window.location.href, document.title, dom];
+"""
+
+
+class StateRecorder:
+    """Ring buffer of recent page states, filled at Allure step boundaries."""
+
+    def __init__(self):
+        self.enabled = False
+        self.capacity = 10
+        self.screenshots = False
+        self.dom_chars = 0
+        self.browser = None
+        self.states = deque(maxlen=self.capacity)
+        self._step_titles = {}
+        self._depth = 0
+        self._capturing = False
+
+    def configure(self, settings):
+        """Applies the `state_recorder` section of config.json."""
+        self.enabled = settings.get('enabled', False)
+        self.capacity = settings.get('capacity', 10)
+        self.screenshots = settings.get('screenshots', False)
+        self.dom_chars = settings.get('dom_chars', 0)
+        self.states = deque(maxlen=self.capacity)
+
+    def start_test(self, browser):
+        self.browser = browser if self.enabled else None
+        self.states.clear()
+        self._step_titles.clear()
+        self._depth = 0
+
+    def finish_test(self):
+        self.browser = None
+        self.states.clear()
+
+    # -------------------------------------------------------------------------
+    # ALLURE STEP HOOKS
+    # -------------------------------------------------------------------------
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        if self.browser is not None:
+            self._step_titles[uuid] = title
+            self._depth += 1
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        title = self._step_titles.pop(uuid, None)
+        if title is None:
+            return
+        self._depth -= 1
+        # Only the outermost step is captured; its nested helper steps would repeat the same state
+        if self.browser is not None and self._depth == 0:
+            self.capture(title, failed=exc_type is not None)
+
+    # -------------------------------------------------------------------------
+    # CAPTURE / FLUSH
+    # -------------------------------------------------------------------------
+    def capture(self, step, failed=False):
+        """Adds the current page state to the buffer. Never raises."""
+        if self._capturing:
+            return
+        self._capturing = True
+        try:
+            url, title, dom = self.browser.execute_script(_STATE_JS, self.dom_chars)
+            self.states.append({
+                "step": step,
+                "failed": failed,
+                "time": time.time(),
+                "url": url,
+                "title": title,
+                "dom": zlib.compress(dom.encode('utf-8')) if dom else None,
+                "screenshot": self.browser.get_screenshot_as_png() if self.screenshots else None,
+            })
+        except Exception as e:
+            print(f"⚠️ Could not record page state for step '{step}': {e}")
+        finally:
+            self._capturing = False
+
+    def flush(self, nodeid):
+        """
+        Writes the buffered states of a failed test to disk and Allure.
+
+        :return: Folder the states were written to, or None if the buffer is empty.
+        """
+        if not self.states:
+            return None
+        test_name = nodeid.replace("::", "_").replace("/", "_")
+        folder = os.path.join(STEPS_REPORT_DIR, f"{test_name}_steps")
+        os.makedirs(folder, exist_ok=True)
+
+        index = []
+        for number, state in enumerate(self.states, start=1):
+            prefix = f"{number:02d}"
+            entry = {key: state[key] for key in ("step", "failed", "time", "url", "title")}
+            if state["screenshot"]:
+                entry["screenshot"] = f"{prefix}.png"
+                with open(os.path.join(folder, entry["screenshot"]), 'wb') as file:
+                    file.write(state["screenshot"])
+                allure.attach(state["screenshot"], name=f"{prefix} {state['step']}",
+                              attachment_type=allure.attachment_type.PNG)
+            if state["dom"]:
+                entry["dom"] = f"{prefix}.html"
+                with open(os.path.join(folder, entry["dom"]), 'wb') as file:
+                    file.write(zlib.decompress(state["dom"]))
+            index.append(entry)
+
+        states_json = json.dumps(index, indent=2)
+        with open(os.path.join(folder, "states.json"), 'w', encoding='utf-8') as file:
+            file.write(states_json)
+        allure.attach(states_json, name="recent_page_states", attachment_type=allure.attachment_type.JSON)
+        print(f"🎞 Last {len(index)} page states saved: {folder}")
+        return folder
+
+
+state_recorder = StateRecorder()
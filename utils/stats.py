@@ -0,0 +1,28 @@
+"""
+stats.py
+========
+
+Small statistics helpers shared by the page performance summary and the
+load runner. No third-party imports, so `python -m utils.load_runner --help`
+works without Selenium or Allure installed.
+
+Typical usage:
+--------------
+from utils.stats import percentile
+
+p95 = percentile(latencies, 95)
+"""
+
+import math
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile of a non-empty list.
+
+    :param values: Numbers in any order.
+    :param pct: Percentile between 0 and 100.
+    :return: The smallest value with at least `pct` percent of the values at or below it.
+    """
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(pct / 100 * len(ordered))) - 1]
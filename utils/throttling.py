@@ -0,0 +1,78 @@
+"""
+throttling.py
+=============
+
+This module applies named network/CPU throttling profiles from `config.json`
+through Chrome DevTools:
+
+- `Network.emulateNetworkConditions` (latency, download/upload throughput)
+- `Emulation.setCPUThrottlingRate` (CPU slowdown factor)
+
+DevTools commands are sent with `execute_cdp_cmd`, which local Chrome sessions
+support. Other browsers and Remote sessions run unthrottled with a warning.
+
+Configuration (config.json):
+----------------------------
+"throttling_profiles": {
+  "3g": {"network": {"latency_ms": 563, "download_kbps": 1440, "upload_kbps": 675}},
+  "cpu-4x": {"cpu_slowdown": 4}
+}
+
+Typical usage:
+--------------
+profile = resolve_profile(config, "3g")
+apply_profile(browser, "3g", profile)
+...
+reset_throttling(browser)
+"""
+
+_NO_THROTTLING = {"offline": False, "latency": 0, "downloadThroughput": -1, "uploadThroughput": -1}
+
+
+def _kbps_to_bytes_per_second(kbps):
+    return int(kbps * 1024 / 8)
+
+
+def resolve_profile(config, name):
+    """
+    Looks a profile up in config.json.
+
+    :raises ValueError: If the profile is not defined.
+    """
+    profiles = config.get('throttling_profiles', {})
+    if name not in profiles:
+        raise ValueError(f"Unknown throttling profile: {name} (available: {', '.join(profiles)})")
+    return profiles[name]
+
+
+def apply_profile(browser, name, profile):
+    """
+    Applies a throttling profile to the browser.
+
+    :return: True if the profile was applied, False if the browser can't be throttled.
+    """
+    if not hasattr(browser, "execute_cdp_cmd"):
+        print(f"⚠️ Throttling profile '{name}' needs a local Chrome session; running unthrottled.")
+        return False
+
+    network = profile.get('network')
+    if network:
+        browser.execute_cdp_cmd("Network.enable", {})
+        browser.execute_cdp_cmd("Network.emulateNetworkConditions", {
+            "offline": network.get('offline', False),
+            "latency": network.get('latency_ms', 0),
+            "downloadThroughput": _kbps_to_bytes_per_second(network['download_kbps'])
+            if 'download_kbps' in network else -1,
+            "uploadThroughput": _kbps_to_bytes_per_second(network['upload_kbps'])
+            if 'upload_kbps' in network else -1,
+        })
+    if profile.get('cpu_slowdown'):
+        browser.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": profile['cpu_slowdown']})
+    print(f"🐢 Throttling profile applied: {name}")
+    return True
+
+
+def reset_throttling(browser):
+    """Removes network and CPU throttling so the next test starts unthrottled."""
+    browser.execute_cdp_cmd("Network.emulateNetworkConditions", _NO_THROTTLING)
+    browser.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": 1})